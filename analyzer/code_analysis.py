@@ -1,14 +1,369 @@
 import ast
+import concurrent.futures
+import hashlib
+import json
+import mmap
 import os
 import re
+import tempfile
+from types import SimpleNamespace
 from typing import Dict, Any, List, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+try:
+    # blake3 is much faster on large files but optional
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    _content_hasher = hashlib.sha256
+
+# Mixed into the on-disk result-cache key; bump whenever analysis output
+# changes so entries written by older code are never served for an
+# unchanged file.
+_CACHE_VERSION = 2
+
+try:
+    # Optional JIT for the loop-nesting byte scanner; the regex tokenizer
+    # below remains the fallback when numba (or numpy) is unavailable.
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _count_max_loop_nesting = None
+else:
+    @_njit(cache=True)
+    def _count_max_loop_nesting(buf):
+        """Max nesting of for(/while( vs } tokens, on a uint8 view of the source."""
+        depth = 0
+        max_depth = 0
+        i = 0
+        n = buf.shape[0]
+        while i < n:
+            c = buf[i]
+            if c == 125:  # '}'
+                if depth > 0:
+                    depth -= 1
+                i += 1
+                continue
+            if c == 102 or c == 119:  # 'f' or 'w'
+                if i > 0:
+                    p = buf[i - 1]
+                    # \b: keyword must not continue an identifier
+                    if (48 <= p <= 57) or (65 <= p <= 90) or (97 <= p <= 122) or p == 95:
+                        i += 1
+                        continue
+                if c == 102 and i + 2 < n and buf[i + 1] == 111 and buf[i + 2] == 114:
+                    j = i + 3  # 'for'
+                elif (c == 119 and i + 4 < n and buf[i + 1] == 104 and buf[i + 2] == 105
+                      and buf[i + 3] == 108 and buf[i + 4] == 101):
+                    j = i + 5  # 'while'
+                else:
+                    i += 1
+                    continue
+                k = j
+                while k < n and (buf[k] == 32 or 9 <= buf[k] <= 13):  # \s*
+                    k += 1
+                if k < n and buf[k] == 40:  # '('
+                    depth += 1
+                    if depth > max_depth:
+                        max_depth = depth
+                    i = k + 1
+                    continue
+                i = j
+                continue
+            i += 1
+        return max_depth
+
+# Directories smaller than this are analyzed sequentially; process pool
+# startup costs more than it saves on a handful of files.
+_PARALLEL_MIN_FILES = 8
+
+# Complexity classes in ascending order, plus the reverse mapping so the
+# lattice operations below reduce to integer comparisons instead of
+# list.index scans. Strings remain the currency everywhere else.
+_COMPLEXITY_ORDER = ('O(1)', 'O(log n)', 'O(n)', 'O(n log n)', 'O(n²)', 'O(n³)', 'O(n³+)', 'O(n!)')
+_COMPLEXITY_RANK = {name: rank for rank, name in enumerate(_COMPLEXITY_ORDER)}
+
+# Complexity class per loop-nesting depth, clamped at the last entry
+_CX_AT_DEPTH = ('O(1)', 'O(n)', 'O(n²)', 'O(n³)', 'O(n³+)')
+
+# Highest class the structural folds can produce (loops clamp at O(n³+),
+# call tables top out below it); once a fold reaches this rank, visiting
+# further siblings cannot change the answer.
+_RANK_CEILING = _COMPLEXITY_RANK['O(n³+)']
+
+# Shared default for `metrics.get(...) or _EMPTY` chains; never mutated.
+# Reusing one dict avoids allocating a fresh {} default per lookup.
+_EMPTY: Dict[str, Any] = {}
+
+# Scoring tables for the per-file quality/complexity scores, indexed by
+# _COMPLEXITY_RANK so a lookup is one tuple indexing instead of a string
+# hash. Entries follow _COMPLEXITY_ORDER; O(n³) scores like O(n³+).
+_QUALITY_PENALTIES = (0, 2, 5, 10, 20, 30, 30, 40)
+_COMPLEXITY_SCORES = (10, 20, 30, 50, 70, 90, 90, 100)
+
+# Known time complexities of builtins and common methods. Module-level so
+# the tables are built once, not on every Call node visit; AST identifiers
+# are already interned by CPython, so lookups are pointer compares.
+_BUILTIN_TIME_CX = {
+    'sorted': 'O(n log n)',
+    'max': 'O(n)',
+    'min': 'O(n)',
+    'sum': 'O(n)',
+    'len': 'O(1)',
+    'abs': 'O(1)',
+    'int': 'O(1)',
+    'float': 'O(1)',
+    'str': 'O(1)',
+    'list': 'O(n)',  # Converting to list
+    'tuple': 'O(n)',  # Converting to tuple
+    'set': 'O(n)',   # Converting to set
+    'dict': 'O(n)',  # Converting to dict
+    'enumerate': 'O(1)',  # Iterator creation is O(1)
+    'zip': 'O(1)',    # Iterator creation is O(1)
+    'range': 'O(1)',  # range is lazy
+    'reversed': 'O(1)',  # Iterator creation is O(1)
+}
+_METHOD_TIME_CX = {
+    'sort': 'O(n log n)',
+    'append': 'O(1)',
+    'pop': 'O(1)',
+    'insert': 'O(n)',
+    'remove': 'O(n)',
+    'index': 'O(n)',
+    'count': 'O(n)',
+    'reverse': 'O(n)',
+    'copy': 'O(n)',
+    'clear': 'O(1)',
+    'extend': 'O(k)',  # k is length of extended iterable
+    'split': 'O(n)',
+    'join': 'O(n)',
+    'replace': 'O(n)',
+    'strip': 'O(n)',
+    'find': 'O(n)',
+    'get': 'O(1)',     # dict.get
+    'keys': 'O(1)',    # returns view, not copy
+    'values': 'O(1)',  # returns view, not copy
+    'items': 'O(1)',   # returns view, not copy
+    'update': 'O(k)',  # k is size of update
+}
+
+# Space-complexity counterparts for calls that allocate
+_BUILTIN_SPACE_CX = {
+    'list': 'O(n)',
+    'dict': 'O(n)',
+    'set': 'O(n)',
+    'tuple': 'O(n)',
+    'range': 'O(1)',   # range is lazy in Python 3
+    'sorted': 'O(n)',  # sorted creates a new list
+}
+_METHOD_SPACE_CX = {
+    'copy': 'O(n)',
+    'deepcopy': 'O(n)',
+    'split': 'O(n)',
+    'splitlines': 'O(n)',
+    'keys': 'O(n)',
+    'values': 'O(n)',
+    'items': 'O(n)',
+}
+
+
+def _analyze_file_worker(file_path: str) -> Dict[str, Any]:
+    """Analyze one file in a worker process (must be module-level to pickle)."""
+    return CodeAnalyzer().analyze_file(file_path)
+
+
+def _total_issues(issues: Dict[str, List[str]]) -> int:
+    """Total issue count across all categories; map(len, ...) stays in C."""
+    return sum(map(len, issues.values()))
+
+
+class _StopWalk(Exception):
+    """Raised by visitors to abandon a traversal once the answer is known."""
+
+
+class _AccumulatingOpsCheck(ast.NodeVisitor):
+    """Detect calls that grow a data structure, stopping on the first hit."""
+
+    _GROW_METHODS = frozenset({'append', 'extend', 'add', 'update', 'insert'})
+
+    def __init__(self):
+        self.found = False
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Attribute) and node.func.attr in self._GROW_METHODS:
+            self.found = True
+            raise _StopWalk
+        self.generic_visit(node)
+
+
+class _FunctionIndexer(ast.NodeVisitor):
+    """Collect per-function facts for the recursion heuristics in one pass.
+
+    The recursive-complexity analyzers previously re-walked every function's
+    subtree several times (once per heuristic and once per time/space pass).
+    This visitor walks the tree exactly once, tracking the stack of enclosing
+    functions, and records for each FunctionDef the same facts those walks
+    were extracting: self-call count, slicing, halving patterns, and data
+    structure creation. Facts seen inside nested functions are credited to
+    every enclosing function, matching the old per-function ``ast.walk``
+    semantics.
+    """
+
+    def __init__(self):
+        self.info = {}
+        self.functions = []
+        self.loaded_names = set()
+        self.stored_names = set()
+        self._stack = []
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Store):
+            self.stored_names.add(node.id)
+        elif isinstance(node.ctx, ast.Load):
+            self.loaded_names.add(node.id)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.functions.append(node)
+        self.info[node] = SimpleNamespace(
+            recursive_calls=0,
+            has_slicing=False,
+            divides_problem=False,
+            creates_data_structures=False,
+        )
+        self._stack.append(node)
+        self.generic_visit(node)
+        self._stack.pop()
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Name):
+            called = func.id
+        elif (isinstance(func, ast.Attribute)
+              and isinstance(func.value, ast.Name) and func.value.id == 'self'):
+            # Method-style self-calls (self.f() inside f) count as recursion;
+            # the attribute name is what matches the enclosing function.
+            # Restricting to `self.` keeps super().__init__() from matching.
+            called = func.attr
+        else:
+            called = None
+        if called is not None:
+            for enclosing in self._stack:
+                if enclosing.name == called:
+                    self.info[enclosing].recursive_calls += 1
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node):
+        if isinstance(node.slice, ast.Slice):
+            for func in self._stack:
+                info = self.info[func]
+                info.has_slicing = True
+                info.divides_problem = True
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        # Halving patterns like mid = (left + right) // 2. `type() is` is a
+        # pointer compare; AST node classes are never subclassed, so it is
+        # equivalent to isinstance here and skips the MRO walk per node.
+        value = node.value
+        if type(value) is ast.BinOp and type(value.op) is ast.FloorDiv:
+            right = value.right
+            if type(right) is ast.Constant and right.value == 2:
+                for func in self._stack:
+                    self.info[func].divides_problem = True
+        self.generic_visit(node)
+
+    def _mark_data_structure(self, node):
+        for func in self._stack:
+            self.info[func].creates_data_structures = True
+        self.generic_visit(node)
+
+    visit_List = _mark_data_structure
+    visit_Dict = _mark_data_structure
+    visit_Set = _mark_data_structure
+    visit_ListComp = _mark_data_structure
+    visit_DictComp = _mark_data_structure
+    visit_SetComp = _mark_data_structure
+
 
 class CodeAnalyzer:
+    # Precompiled regex patterns shared by all instances. Compiling once at
+    # import time avoids re-parsing pattern strings (and re's bounded pattern
+    # cache) on every call in the per-file analysis hot path.
+    _RE_JAVA_PRINT = re.compile(r'System\.out\.print')
+    _RE_TRY = re.compile(r'\btry\s*\{')
+    _RE_CATCH = re.compile(r'\bcatch\s*\(')
+    _RE_MAGIC = re.compile(r'\b(?<![\w.])\d+(?![\w.])\b')
+    _RE_MALLOC = re.compile(r'\bmalloc\s*\(')
+    _RE_FREE = re.compile(r'\bfree\s*\(')
+    _RE_STRCPY = re.compile(r'\bstrcpy\s*\(')
+    _RE_GETS = re.compile(r'\bgets\s*\(')
+    _RE_RAWPTR = re.compile(r'\braw\s+pointer')
+    _RE_SMARTPTR = re.compile(r'\bstd::(unique_ptr|shared_ptr)')
+    _RE_TRAD_FOR = re.compile(r'\bfor\s*\(\s*\w+\s*=\s*0\s*;.*\.size\(\)')
+    _RE_FOR = re.compile(r'\bfor\s*\(')
+    _RE_WHILE = re.compile(r'\bwhile\s*\(')
+    _RE_LOOP = re.compile(r'\b(for|while)\s*\(')
+    _RE_LOOP_TOKENS = re.compile(r'\bfor\s*\(|\bwhile\s*\(|\}')
+    _RE_SORT = re.compile(r'\bsort\s*\(|\.sort\s*\(')
+    _RE_NEW_ARR = re.compile(r'new\s+\w+\s*\[')
+    _RE_NEW = re.compile(r'new\s+\w+')
+    _RE_COLLECTIONS = re.compile(r'(ArrayList|Vector|HashMap|HashSet|LinkedList)')
+    _RE_RECURSIVE = re.compile(r'(\w+)\s*\([^)]*\)\s*\{[^}]*\1\s*\(')
+    _RE_2D_ARR = re.compile(r'new\s+\w+\s*\[\s*\]\s*\[\s*\]')
+    _RE_C_COMMENTS = re.compile(r'//[^\n]*|/\*[\s\S]*?\*/')
+    # One alternation covering every C/C++ pattern check; each match reports
+    # its kind so a single pass yields all the per-pattern counts.
+    _RE_C_CPP_SCAN = re.compile(
+        r'\b(?P<call>malloc|free|strcpy|gets)\s*\('
+        r'|(?P<rawptr>\braw\s+pointer)'
+        r'|(?P<smartptr>\bstd::(?:unique_ptr|shared_ptr))'
+        r'|(?P<tradfor>\bfor\s*\(\s*\w+\s*=\s*0\s*;.*\.size\(\))'
+    )
+    _RE_BLANK_LINE = re.compile(r'(?m)^[ \t\f\v\r]*$')
+    _RE_HASH_COMMENT = re.compile(r'(?m)^[ \t\f\v\r]*#')
+    # Tokens for the allocation-in-loop scan: loop openers, allocations,
+    # line-closing braces and the newlines that delimit the line-oriented
+    # state machine, all emitted by one pass instead of a per-line split.
+    _RE_SPACE_SCAN = re.compile(
+        r'\b(?P<loop>(?:for|while)\s*\()'
+        r'|(?P<alloc>new\s+\w+|\bmalloc\s*\()'
+        r'|(?P<closer>\}[ \t\f\v\r]*(?=\n|\Z))'
+        r'|(?P<nl>\n)'
+    )
+
     def __init__(self):
-        self.issues = defaultdict(list)
+        self.issues = {}
         self.metrics = {}
-        
+        self._func_index = {}
+        self._tree_functions = []
+        # Per-analysis memo tables keyed by id(node); both the time and the
+        # space pass visit the same FunctionDefs, so cache their results for
+        # the lifetime of one analyze_file call.
+        self._memo_func_complexity = {}
+        self._memo_func_space = {}
+        self._node_cx = {}
+
+        # On-disk result cache so repeated scans of unchanged files skip the
+        # parse/analysis entirely. Keyed by path + content hash (plus the
+        # language map and _CACHE_VERSION, so extension or analyzer changes
+        # invalidate stale entries). The directory is per-user: the temp dir
+        # is shared, and a directory owned by someone else would make every
+        # cache write fail silently.
+        suffix = f'-{os.getuid()}' if hasattr(os, 'getuid') else ''
+        self._cache_dir = os.path.join(tempfile.gettempdir(), f'pyca_cache{suffix}')
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+        except OSError:
+            self._cache_dir = None
+
+        # In-memory result memo keyed by (path, mtime_ns, size). Sits in
+        # front of the disk cache so repeat analyses of an unchanged file
+        # (e.g. get_detailed_complexity_data after a directory scan) skip
+        # even the read + content hash.
+        self._result_memo = {}
+
+
         # Supported file extensions and their languages
         self.language_map = {
             '.py': 'python',
@@ -24,52 +379,185 @@ class CodeAnalyzer:
             '.hxx': 'cpp'
         }
 
+        # Suffix tuple for str.endswith filtering in directory walks; one
+        # C-level scan per file name instead of splitext + dict lookup.
+        self._suffixes = tuple(self.language_map)
+
+        # Language dispatch table replacing the if/elif chain per file
+        self._dispatch = {
+            'python': self._analyze_python,
+            'java': self._analyze_java,
+            'c': self._analyze_c,
+            'cpp': self._analyze_cpp,
+        }
+
     def analyze_file(self, file_path: str) -> Dict[str, Any]:
-        self.issues.clear()
+        self.issues = {}
         self.metrics = {}
+        self._memo_func_complexity.clear()
+        self._memo_func_space.clear()
+        self._node_cx.clear()
 
-        file_ext = os.path.splitext(file_path)[1].lower()
+        # rpartition skips splitext's drive/UNC handling. A dot anywhere in
+        # the path can yield a junk "extension" (even from a directory
+        # name), but anything that isn't a real supported suffix simply
+        # misses the language map below, same as the dotless '' case
+        _, dot, tail = file_path.rpartition('.')
+        file_ext = '.' + tail.lower() if dot else ''
         language = self.language_map.get(file_ext)
         
         if not language:
-            self.issues['General Errors'].append(f"Unsupported file type: {file_ext}")
+            self._add_issue('General Errors', f"Unsupported file type: {file_ext}")
             return {'issues': self.issues, 'metrics': self.metrics, 'file_path': file_path}
 
+        memo_key = None
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                code = f.read()
-
-            if language == 'python':
-                self._analyze_python(code)
-            elif language == 'java':
-                self._analyze_java(code)
-            elif language == 'c':
-                self._analyze_c(code)
-            elif language == 'cpp':
-                self._analyze_cpp(code)
+            st = os.stat(file_path)
+            memo_key = (file_path, st.st_mtime_ns, st.st_size)
+            memoized = self._result_memo.get(memo_key)
+            if memoized is not None:
+                return memoized
+        except OSError:
+            pass
+
+        cache_path = None
+        try:
+            raw = self._read_bytes(file_path)
+
+            cache_path = self._result_cache_path(file_path, raw)
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                self._memoize_result(memo_key, cached)
+                return cached
+
+            code = raw.decode('utf-8', errors='ignore')
+            self._dispatch[language](code)
 
         except Exception as e:
-            self.issues['General Errors'].append(f"Error analyzing file: {str(e)}")
+            self._add_issue('General Errors', f"Error analyzing file: {str(e)}")
+
+        result = {'issues': self.issues, 'metrics': self.metrics, 'file_path': file_path, 'language': language}
+        self._store_cached_result(cache_path, result)
+        self._memoize_result(memo_key, result)
+        return result
+
+    def invalidate(self, file_path: str):
+        """Drop memoized results for one file, forcing re-analysis.
+
+        Only the in-memory memo needs busting; the disk cache is keyed by
+        content hash and goes stale on its own when the file changes.
+        """
+        self._result_memo = {k: v for k, v in self._result_memo.items()
+                             if k[0] != file_path}
 
-        non_empty = {k: v for k, v in self.issues.items() if v}
-        return {'issues': non_empty, 'metrics': self.metrics, 'file_path': file_path, 'language': language}
+    def _memoize_result(self, memo_key, result: Dict[str, Any]):
+        """Remember a result for the file's current (mtime, size) stamp."""
+        if memo_key is None:
+            return
+        if len(self._result_memo) >= 512:
+            self._result_memo.clear()
+        self._result_memo[memo_key] = result
+
+    def _add_issue(self, category: str, message: str):
+        """Record an issue; categories exist only once they have entries."""
+        self.issues.setdefault(category, []).append(message)
+
+    def _read_bytes(self, file_path: str) -> bytes:
+        """Read a file's raw bytes, via mmap when the file can be mapped.
+
+        The slice copies the mapped pages into one exact-size bytes object
+        in a single step, skipping buffered IO's chunked reads — but it is
+        still a copy; the hasher and decoder consume the bytes, not the
+        mapping.
+        """
+        with open(file_path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[:]
+            except (ValueError, OSError):
+                # Empty files and exotic filesystems cannot be mapped
+                return f.read()
+
+    def _result_cache_path(self, file_path: str, raw: bytes) -> Optional[str]:
+        """Build the cache file path for a file's current content."""
+        if not self._cache_dir:
+            return None
+        hasher = _content_hasher()
+        hasher.update(f'v{_CACHE_VERSION}:'.encode())
+        hasher.update(file_path.encode('utf-8', errors='ignore'))
+        hasher.update(repr(sorted(self.language_map.items())).encode())
+        hasher.update(raw)
+        return os.path.join(self._cache_dir, hasher.hexdigest() + '.json')
+
+    def _load_cached_result(self, cache_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis result, or None on a miss."""
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_result(self, cache_path: Optional[str], result: Dict[str, Any]):
+        """Persist an analysis result; cache failures are non-fatal."""
+        if not cache_path:
+            return
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _iter_source_files(self, root: str):
+        """Yield paths of supported source files under root.
+
+        Traverses with os.scandir and an explicit directory stack: DirEntry
+        answers is_dir()/is_file() from the directory read itself, so this
+        skips the per-entry stat and path join that os.walk pays. Symlinked
+        directories are not followed, matching the os.walk default.
+        """
+        suffixes = self._suffixes
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                if not entry.is_symlink():
+                                    stack.append(entry.path)
+                            elif entry.name.lower().endswith(suffixes):
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                continue
 
     def analyze_directory(self, directory: str) -> List[Dict[str, Any]]:
-        results = []
-        for root, _, files in os.walk(directory):
-            for file in files:
-                file_ext = os.path.splitext(file)[1].lower()
-                if file_ext in self.language_map:
-                    results.append(self.analyze_file(os.path.join(root, file)))
-        return results
+        paths = list(self._iter_source_files(directory))
+
+        # Per-file analysis is independent and CPU-bound (AST + regex), so
+        # large directories are fanned out to a process pool.
+        if len(paths) >= _PARALLEL_MIN_FILES:
+            try:
+                with concurrent.futures.ProcessPoolExecutor() as executor:
+                    return list(executor.map(_analyze_file_worker, paths, chunksize=8))
+            except (OSError, concurrent.futures.process.BrokenProcessPool):
+                pass  # Fall back to the sequential path below
+
+        return [self.analyze_file(path) for path in paths]
 
     def _analyze_python(self, code: str):
         """Analyze Python code using AST."""
         try:
             tree = ast.parse(code)
+            indexer = self._index_tree(tree)
+            self._func_index = indexer.info
+            self._tree_functions = indexer.functions
             self._check_complexity(tree)
             self._calculate_metrics(tree, code)
-            self._check_unused_variables(tree)
+            self._check_unused_variables(indexer)
             
             # Ensure time complexity is set
             if 'time_complexity' not in self.metrics:
@@ -81,7 +569,7 @@ class CodeAnalyzer:
                 self.metrics['space_complexity'] = space_complexity
                 
         except SyntaxError as e:
-            self.issues['Syntax Errors'].append(f"Line {e.lineno}: {e.msg}")
+            self._add_issue('Syntax Errors', f"Line {e.lineno}: {e.msg}")
 
     def _analyze_java(self, code: str):
         """Analyze Java code using regex patterns."""
@@ -105,93 +593,136 @@ class CodeAnalyzer:
         self._estimate_space_complexity_from_text(code, 'cpp')
 
     def _calculate_basic_metrics(self, code: str, language: str):
-        """Calculate basic metrics for any language."""
-        lines = code.split('\n')
-        self.metrics['lines_of_code'] = len(lines)
-        
-        # Comment patterns by language
-        comment_patterns = {
-            'java': [r'//.*', r'/\*[\s\S]*?\*/'],
-            'c': [r'//.*', r'/\*[\s\S]*?\*/'],
-            'cpp': [r'//.*', r'/\*[\s\S]*?\*/']
-        }
-        
+        """Calculate basic metrics for any language.
+
+        All counts run in C: str.count for the line total and multiline
+        regexes for blanks and comments, so no per-line Python loop or
+        split list is needed.
+        """
+        self.metrics['lines_of_code'] = code.count('\n') + 1
+
         comment_lines = 0
-        if language in comment_patterns:
-            for pattern in comment_patterns[language]:
-                comment_lines += len(re.findall(pattern, code, re.MULTILINE))
-        
+        if language in ('java', 'c', 'cpp'):
+            comment_lines = self._count_c_comments(code)
+
         self.metrics['comment_lines'] = comment_lines
-        self.metrics['blank_lines'] = sum(1 for line in lines if not line.strip())
+        self.metrics['blank_lines'] = sum(1 for _ in self._RE_BLANK_LINE.finditer(code))
+
+    @staticmethod
+    def _count_c_comments(code: str) -> int:
+        """Count // and /* */ comments with a linear str.find scan.
+
+        The previous r'/\\*[\\s\\S]*?\\*/' alternation backtracks per
+        character after an unterminated /*, going quadratic on pathological
+        inputs. str.find runs in C and guarantees one pass. An unterminated
+        block opener falls through one character, like the regex engine
+        retrying at the next position, so a later // is still counted.
+        """
+        count = 0
+        i = 0
+        n = len(code)
+        find = code.find
+        while True:
+            i = find('/', i)
+            if i < 0 or i + 1 >= n:
+                return count
+            nxt = code[i + 1]
+            if nxt == '/':
+                count += 1
+                j = find('\n', i + 2)
+                i = n if j < 0 else j + 1
+            elif nxt == '*':
+                j = find('*/', i + 2)
+                if j < 0:
+                    i += 1
+                    continue
+                count += 1
+                i = j + 2
+            else:
+                i += 2
 
     def _analyze_java_patterns(self, code: str):
         """Analyze Java-specific patterns."""
         # Check for common issues
-        if re.search(r'System\.out\.print', code):
-            self.issues['Best Practices'].append("Consider using a logging framework instead of System.out.print")
-        
-        # Check for proper exception handling
-        try_blocks = len(re.findall(r'\btry\s*\{', code))
-        catch_blocks = len(re.findall(r'\bcatch\s*\(', code))
+        if self._RE_JAVA_PRINT.search(code):
+            self._add_issue('Best Practices', "Consider using a logging framework instead of System.out.print")
+
+        # Check for proper exception handling; finditer counts without
+        # materializing a list of match strings
+        try_blocks = sum(1 for _ in self._RE_TRY.finditer(code))
+        catch_blocks = sum(1 for _ in self._RE_CATCH.finditer(code))
         if try_blocks > catch_blocks:
-            self.issues['Exception Handling'].append("Try blocks without corresponding catch blocks detected")
+            self._add_issue('Exception Handling', "Try blocks without corresponding catch blocks detected")
         
-        # Check for magic numbers
-        magic_numbers = re.findall(r'\b(?<![\w.])\d+(?![\w.])\b', code)
-        if len(magic_numbers) > 5:
-            self.issues['Code Quality'].append(f"Consider using constants for magic numbers: {set(magic_numbers)}")
+        # Check for magic numbers; stream the matches and stop as soon as
+        # enough distinct literals are seen instead of collecting them all.
+        magic_numbers = set()
+        for match in self._RE_MAGIC.finditer(code):
+            magic_numbers.add(match.group())
+            if len(magic_numbers) > 5:
+                self._add_issue('Code Quality',
+                                f"Consider using constants for magic numbers: {sorted(magic_numbers)}")
+                break
 
-    def _analyze_c_patterns(self, code: str):
+    def _scan_c_family(self, code: str) -> Dict[str, int]:
+        """Count all C/C++ pattern hits in a single pass over the source."""
+        counts = defaultdict(int)
+        for match in self._RE_C_CPP_SCAN.finditer(code):
+            kind = match.lastgroup
+            counts[match.group('call') if kind == 'call' else kind] += 1
+        return counts
+
+    def _analyze_c_patterns(self, code: str, counts: Optional[Dict[str, int]] = None):
         """Analyze C-specific patterns."""
+        if counts is None:
+            counts = self._scan_c_family(code)
+
         # Check for memory management
-        malloc_count = len(re.findall(r'\bmalloc\s*\(', code))
-        free_count = len(re.findall(r'\bfree\s*\(', code))
+        malloc_count = counts['malloc']
+        free_count = counts['free']
         if malloc_count > free_count:
-            self.issues['Memory Management'].append(f"Potential memory leak: {malloc_count} malloc calls but only {free_count} free calls")
-        
+            self._add_issue('Memory Management', f"Potential memory leak: {malloc_count} malloc calls but only {free_count} free calls")
+
         # Check for buffer overflow risks
-        if re.search(r'\bstrcpy\s*\(', code):
-            self.issues['Security'].append("strcpy() can cause buffer overflows, consider using strncpy()")
-        if re.search(r'\bgets\s*\(', code):
-            self.issues['Security'].append("gets() is unsafe, use fgets() instead")
+        if counts['strcpy']:
+            self._add_issue('Security', "strcpy() can cause buffer overflows, consider using strncpy()")
+        if counts['gets']:
+            self._add_issue('Security', "gets() is unsafe, use fgets() instead")
 
     def _analyze_cpp_patterns(self, code: str):
         """Analyze C++-specific patterns."""
-        # Include C patterns
-        self._analyze_c_patterns(code)
-        
+        counts = self._scan_c_family(code)
+
+        # Include C patterns, reusing the same scan
+        self._analyze_c_patterns(code, counts)
+
         # Check for modern C++ features
-        if re.search(r'\braw\s+pointer', code) and not re.search(r'\bstd::(unique_ptr|shared_ptr)', code):
-            self.issues['Modern C++'].append("Consider using smart pointers instead of raw pointers")
-        
+        if counts['rawptr'] and not counts['smartptr']:
+            self._add_issue('Modern C++', "Consider using smart pointers instead of raw pointers")
+
         # Check for range-based for loops opportunity
-        traditional_loops = len(re.findall(r'\bfor\s*\(\s*\w+\s*=\s*0\s*;.*\.size\(\)', code))
-        if traditional_loops > 0:
-            self.issues['Modern C++'].append("Consider using range-based for loops for better readability")
+        if counts['tradfor']:
+            self._add_issue('Modern C++', "Consider using range-based for loops for better readability")
 
     def _estimate_complexity_from_text(self, code: str, language: str):
         """Estimate time complexity from text patterns."""
-        # Count nested loops
-        nested_depth = 0
-        max_depth = 0
-        current_depth = 0
-        
-        # Pattern matching for different languages
-        if language in ['java', 'c', 'cpp']:
-            for_pattern = r'\bfor\s*\('
-            while_pattern = r'\bwhile\s*\('
-            brace_open = r'\{'
-            brace_close = r'\}'
-        
-        # Simple heuristic: count loop nesting
-        lines = code.split('\n')
-        for line in lines:
-            stripped = line.strip()
-            if re.search(for_pattern, stripped) or re.search(while_pattern, stripped):
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-            elif stripped.endswith('}') and current_depth > 0:
-                current_depth = max(0, current_depth - 1)
+        # Simple heuristic: count loop nesting. With numba installed this is
+        # a JIT-compiled scalar loop over the raw bytes; otherwise a single
+        # alternation pass emits loop-opener and closing-brace tokens.
+        if _count_max_loop_nesting is not None:
+            max_depth = _count_max_loop_nesting(
+                _np.frombuffer(code.encode('utf-8', errors='ignore'), dtype=_np.uint8))
+        else:
+            max_depth = 0
+            current_depth = 0
+            for match in self._RE_LOOP_TOKENS.finditer(code):
+                if match.group() == '}':
+                    if current_depth > 0:
+                        current_depth -= 1
+                else:
+                    current_depth += 1
+                    if current_depth > max_depth:
+                        max_depth = current_depth
         
         # Estimate complexity based on max nesting
         if max_depth == 0:
@@ -204,7 +735,7 @@ class CodeAnalyzer:
             complexity = 'O(n³+)'
         
         # Check for sorting algorithms
-        if re.search(r'\bsort\s*\(', code) or re.search(r'\.sort\s*\(', code):
+        if self._RE_SORT.search(code):
             complexity = 'O(n log n)' if complexity == 'O(1)' else complexity
         
         self.metrics['time_complexity'] = {'overall': complexity, 'estimated': True}
@@ -212,17 +743,19 @@ class CodeAnalyzer:
     def _calculate_space_complexity(self, tree: ast.AST) -> Dict[str, Any]:
         """Calculate space complexity for Python code using AST analysis."""
         complexities = {}
+        max_space_complexity = 'O(1)'
 
-        # Analyze all functions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_name = node.name
-                
-                # Check if function is recursive first
-                if self._is_recursive_function(node):
-                    complexities[func_name] = self._analyze_recursive_space(node)
-                else:
-                    complexities[func_name] = self._analyze_function_space_complexity(node)
+        # Analyze all functions (already collected by the tree index),
+        # tracking the running maximum instead of re-scanning the dict
+        for node in self._tree_functions:
+            func_name = node.name
+
+            # Check if function is recursive first
+            if self._is_recursive_function(node):
+                complexities[func_name] = self._analyze_recursive_space(node)
+            else:
+                complexities[func_name] = self._analyze_function_space_complexity(node)
+            max_space_complexity = self._upgrade_complexity(max_space_complexity, complexities[func_name])
 
         # Analyze top-level (module-level) code
         top_level_space_complexity = self._analyze_function_space_complexity(tree)
@@ -234,8 +767,8 @@ class CodeAnalyzer:
         # Add top-level space complexity with special key if not trivial
         if top_level_space_complexity != 'O(1)':
             complexities['<module-level>'] = top_level_space_complexity
+            max_space_complexity = self._upgrade_complexity(max_space_complexity, top_level_space_complexity)
 
-        max_space_complexity = max(complexities.values(), key=self._complexity_weight)
         return {'overall': max_space_complexity, 'functions': complexities}
 
     def _analyze_function_space_complexity(self, node: ast.AST) -> str:
@@ -244,6 +777,8 @@ class CodeAnalyzer:
             max_space_complexity = 'O(1)'
 
             for n in nodes:
+                if _COMPLEXITY_RANK[max_space_complexity] >= _RANK_CEILING:
+                    break  # Already at the ceiling; siblings cannot raise it
                 if isinstance(n, ast.Assign):
                     # Check for data structure allocations
                     for target in n.targets:
@@ -284,23 +819,24 @@ class CodeAnalyzer:
 
             return max_space_complexity
 
+        memo_key = id(node)
+        cached = self._memo_func_space.get(memo_key)
+        if cached is not None:
+            return cached
+
         # For recursive functions, handle them specially
         if hasattr(node, 'name') and self._is_recursive_function(node):
-            return self._analyze_recursive_space(node)
-        
-        # Otherwise, analyze the node body normally
-        return space_complexity_of_nodes(node.body if hasattr(node, 'body') else [])
+            result = self._analyze_recursive_space(node)
+        else:
+            # Otherwise, analyze the node body normally
+            result = space_complexity_of_nodes(node.body if hasattr(node, 'body') else [])
+
+        self._memo_func_space[memo_key] = result
+        return result
     
     def _space_at_depth(self, depth: int) -> str:
-        """Return space complexity for given loop nesting depth."""
-        if depth == 1:
-            return 'O(n)'
-        elif depth == 2:
-            return 'O(n²)'
-        elif depth == 3:
-            return 'O(n³)'
-        else:
-            return 'O(n³+)'
+        """Return space complexity for given loop nesting depth (>= 1)."""
+        return _CX_AT_DEPTH[min(depth, 4)]
 
     def _analyze_value_space_complexity(self, value_node: ast.AST, loop_depth: int = 0) -> str:
         """Analyze space complexity of value assignments."""
@@ -336,133 +872,119 @@ class CodeAnalyzer:
         
         return base_space
 
+    def _index_tree(self, tree: ast.AST) -> _FunctionIndexer:
+        """Index the tree (functions, recursion facts, name usage) in one walk."""
+        indexer = _FunctionIndexer()
+        indexer.visit(tree)
+        return indexer
+
+    def _func_info(self, func_node: ast.FunctionDef) -> SimpleNamespace:
+        """Look up (or lazily build) the indexed facts for a function."""
+        info = self._func_index.get(func_node)
+        if info is None:
+            # Node analyzed outside a full-tree pass; index it on demand.
+            self._func_index.update(self._index_tree(func_node).info)
+            info = self._func_index[func_node]
+        return info
+
     def _analyze_recursive_space(self, func_node: ast.FunctionDef) -> str:
         """Analyze space complexity of recursive functions."""
-        func_name = func_node.name
-        
-        # Count recursive calls and analyze patterns
-        recursive_calls = 0
-        creates_data_structures = False
-        divides_problem = False
-        has_slicing = False
-        
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                if node.func.id == func_name:
-                    recursive_calls += 1
-            
-            # Check if creates new data structures
-            elif isinstance(node, (ast.List, ast.Dict, ast.Set, ast.ListComp, ast.DictComp, ast.SetComp)):
-                creates_data_structures = True
-            
-            # Look for problem division patterns (slicing)
-            elif isinstance(node, ast.Subscript):
-                if isinstance(node.slice, ast.Slice):
-                    divides_problem = True
-                    has_slicing = True
-            
-            # Look for halving patterns like mid = len(arr) // 2
-            elif isinstance(node, ast.Assign):
-                if isinstance(node.value, ast.BinOp) and isinstance(node.value.op, ast.FloorDiv):
-                    if isinstance(node.value.right, ast.Constant) and node.value.right.value == 2:
-                        divides_problem = True
-        
+        info = self._func_info(func_node)
+
         # Heuristics for recursive space complexity
-        if creates_data_structures:
-            if divides_problem and has_slicing:
+        if info.creates_data_structures:
+            if info.divides_problem and info.has_slicing:
                 return 'O(n)'        # Divide and conquer with copying (like merge sort)
             else:
                 return 'O(n²)'       # Each recursive call creates data structures
         else:
             # Only using call stack space
-            if divides_problem:
+            if info.divides_problem:
                 return 'O(log n)'    # Binary search-like recursion (log depth)
-            elif recursive_calls == 1:
+            elif info.recursive_calls == 1:
                 return 'O(n)'        # Linear recursion depth
             else:
                 return 'O(n²)'       # Fibonacci-like recursion
 
     def _analyze_call_space_complexity(self, call_node: ast.Call) -> str:
         """Analyze space complexity of function calls."""
-        if isinstance(call_node.func, ast.Name):
-            func_name = call_node.func.id
-            # Built-in functions that create data structures
-            if func_name in ['list', 'dict', 'set', 'tuple']:
-                return 'O(n)'
-            elif func_name in ['range']:
-                return 'O(1)'  # range is lazy in Python 3
-            elif func_name in ['sorted']:
-                return 'O(n)'  # sorted creates a new list
-        elif isinstance(call_node.func, ast.Attribute):
-            attr_name = call_node.func.attr
-            # Method calls that might create space
-            if attr_name in ['copy', 'deepcopy']:
-                return 'O(n)'
-            elif attr_name in ['split', 'splitlines']:
-                return 'O(n)'
-            elif attr_name in ['keys', 'values', 'items']:
-                return 'O(n)'
-        
+        func = call_node.func
+        if isinstance(func, ast.Name):
+            return _BUILTIN_SPACE_CX.get(func.id, 'O(1)')
+        elif isinstance(func, ast.Attribute):
+            return _METHOD_SPACE_CX.get(func.attr, 'O(1)')
         return 'O(1)'
 
     def _has_accumulating_operations(self, loop_node: ast.AST) -> bool:
         """Check if a loop has operations that accumulate data."""
-        for node in ast.walk(loop_node):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Attribute):
-                    if node.func.attr in ['append', 'extend', 'add', 'update', 'insert']:
-                        return True
-        return False
+        checker = _AccumulatingOpsCheck()
+        try:
+            checker.visit(loop_node)
+        except _StopWalk:
+            pass
+        return checker.found
 
     def _is_recursive_function(self, func_node: ast.FunctionDef) -> bool:
         """Check if a function is recursive."""
-        func_name = func_node.name
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                if node.func.id == func_name:
-                    return True
-        return False
-    
+        return self._func_info(func_node).recursive_calls > 0
+
     def _estimate_space_complexity_from_text(self, code: str, language: str):
         """Estimate space complexity from text patterns for non-Python languages."""
         space_complexity = 'O(1)'
         
         if language in ['java', 'c', 'cpp']:
             # Check for array/collection allocations
-            if re.search(r'new\s+\w+\s*\[', code) or re.search(r'malloc\s*\(', code):
+            if self._RE_NEW_ARR.search(code) or self._RE_MALLOC.search(code):
                 space_complexity = 'O(n)'
-            
+
             # Check for data structure usage
-            if re.search(r'(ArrayList|Vector|HashMap|HashSet|LinkedList)', code):
+            if self._RE_COLLECTIONS.search(code):
                 space_complexity = 'O(n)'
-            
+
             # Check for recursive patterns
-            recursive_patterns = re.findall(r'(\w+)\s*\([^)]*\)\s*\{[^}]*\1\s*\(', code)
-            if recursive_patterns:
+            if self._RE_RECURSIVE.search(code):
                 space_complexity = 'O(n)'
-            
+
             # Check for nested data structures
-            if re.search(r'new\s+\w+\s*\[\s*\]\s*\[\s*\]', code):  # 2D arrays
+            if self._RE_2D_ARR.search(code):  # 2D arrays
                 space_complexity = 'O(n²)'
             
-            # Check for dynamic memory allocation in loops
-            lines = code.split('\n')
+            # Check for dynamic memory allocation in loops. One tokenizing
+            # pass over the whole source; per-line flags are flushed at each
+            # newline so the original line-oriented rules (a loop line never
+            # also counts as a closer or an allocation line) are preserved.
             in_loop = False
             loop_depth = 0
-            for line in lines:
-                stripped = line.strip()
-                if re.search(r'\b(for|while)\s*\(', stripped):
-                    in_loop = True
-                    loop_depth += 1
-                elif stripped.endswith('}') and in_loop:
-                    loop_depth = max(0, loop_depth - 1)
-                    if loop_depth == 0:
-                        in_loop = False
-                elif in_loop and (re.search(r'new\s+\w+', stripped) or re.search(r'malloc\s*\(', stripped)):
-                    if loop_depth == 1:
-                        space_complexity = self._upgrade_complexity(space_complexity, 'O(n)')
-                    elif loop_depth >= 2:
-                        space_complexity = self._upgrade_complexity(space_complexity, 'O(n²)')
+            saw_loop = saw_alloc = saw_closer = False
+            for match in self._RE_SPACE_SCAN.finditer(code):
+                kind = match.lastgroup
+                if kind == 'loop':
+                    saw_loop = True
+                elif kind == 'alloc':
+                    saw_alloc = True
+                elif kind == 'closer':
+                    saw_closer = True
+                else:  # end of line: apply the state machine once per line
+                    if saw_loop:
+                        in_loop = True
+                        loop_depth += 1
+                    elif saw_closer and in_loop:
+                        loop_depth -= 1
+                        if loop_depth == 0:
+                            in_loop = False
+                    elif in_loop and saw_alloc:
+                        if loop_depth == 1:
+                            space_complexity = self._upgrade_complexity(space_complexity, 'O(n)')
+                        elif loop_depth >= 2:
+                            space_complexity = self._upgrade_complexity(space_complexity, 'O(n²)')
+                    saw_loop = saw_alloc = saw_closer = False
+            if saw_loop:
+                in_loop = True
+            elif in_loop and saw_alloc and not saw_closer:
+                if loop_depth == 1:
+                    space_complexity = self._upgrade_complexity(space_complexity, 'O(n)')
+                elif loop_depth >= 2:
+                    space_complexity = self._upgrade_complexity(space_complexity, 'O(n²)')
         
         self.metrics['space_complexity'] = {'overall': space_complexity, 'estimated': True}
 
@@ -471,23 +993,24 @@ class CodeAnalyzer:
         self.metrics['time_complexity'] = complexity
 
     def _calculate_metrics(self, tree: ast.AST, code: str):
-        lines = code.split('\n')
-        self.metrics['lines_of_code'] = len(lines)
-        self.metrics['comment_lines'] = sum(1 for l in lines if l.strip().startswith('#'))
+        self.metrics['lines_of_code'] = code.count('\n') + 1
+        self.metrics['comment_lines'] = sum(1 for _ in self._RE_HASH_COMMENT.finditer(code))
     
     def _calculate_time_complexity(self, tree: ast.AST) -> Dict[str, Any]:
         complexities = {}
+        max_complexity = 'O(1)'
 
-        # Analyze all functions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_name = node.name
-                
-                # Check if function is recursive first
-                if self._is_recursive_function(node):
-                    complexities[func_name] = self._analyze_recursive_complexity(node)
-                else:
-                    complexities[func_name] = self._analyze_function_complexity(node)
+        # Analyze all functions (already collected by the tree index),
+        # tracking the running maximum instead of re-scanning the dict
+        for node in self._tree_functions:
+            func_name = node.name
+
+            # Check if function is recursive first
+            if self._is_recursive_function(node):
+                complexities[func_name] = self._analyze_recursive_complexity(node)
+            else:
+                complexities[func_name] = self._analyze_function_complexity(node)
+            max_complexity = self._upgrade_complexity(max_complexity, complexities[func_name])
 
         # Analyze top-level (module-level) code
         top_level_complexity = self._analyze_function_complexity(tree)
@@ -499,61 +1022,72 @@ class CodeAnalyzer:
         # Add top-level complexity with special key if not trivial
         if top_level_complexity != 'O(1)':
             complexities['<module-level>'] = top_level_complexity
+            max_complexity = self._upgrade_complexity(max_complexity, top_level_complexity)
 
-        max_complexity = max(complexities.values(), key=self._complexity_weight)
         return {'overall': max_complexity, 'functions': complexities}
 
     def _analyze_function_complexity(self, node: ast.AST) -> str:
-        # Recursively calculate complexity of node list (body) considering sequential and nested loops
-        def complexity_of_nodes(nodes: List[ast.AST], current_depth=0) -> str:
-            max_seq_complexity = 'O(1)'
+        memo_key = id(node)
+        cached = self._memo_func_complexity.get(memo_key)
+        if cached is not None:
+            return cached
 
-            for n in nodes:
-                if isinstance(n, (ast.For, ast.While)):
-                    # Check if this is a logarithmic loop (dividing/halving pattern)
-                    if self._is_logarithmic_loop(n):
-                        loop_complexity = 'O(log n)'
-                        body_complexity = complexity_of_nodes(list(ast.iter_child_nodes(n)), 0)  # Don't increase depth for log loops
-                        combined = self._combine_complexities(loop_complexity, body_complexity)
-                    else:
-                        body_complexity = complexity_of_nodes(list(ast.iter_child_nodes(n)), current_depth + 1)
-                        loop_complexity = self._complexity_at_depth(current_depth + 1)
-                        combined = self._combine_complexities(loop_complexity, body_complexity)
-                    
-                    max_seq_complexity = self._upgrade_complexity(max_seq_complexity, combined)
-                    
-                elif isinstance(n, ast.If):
-                    body_complexity = complexity_of_nodes(n.body, current_depth)
-                    orelse_complexity = complexity_of_nodes(n.orelse, current_depth) if n.orelse else 'O(1)'
-                    if_complexity = self._upgrade_complexity(body_complexity, orelse_complexity)
-                    max_seq_complexity = self._upgrade_complexity(max_seq_complexity, if_complexity)
-                    
-                elif isinstance(n, ast.Call):
-                    call_complexity = self._analyze_call_complexity(n)
-                    max_seq_complexity = self._upgrade_complexity(max_seq_complexity, call_complexity)
-                    
-                else:
-                    children = list(ast.iter_child_nodes(n))
-                    if children:
-                        child_complexity = complexity_of_nodes(children, current_depth)
-                        max_seq_complexity = self._upgrade_complexity(max_seq_complexity, child_complexity)
+        # node can be ast.FunctionDef or ast.Module (both have .body)
+        result = self._complexity_of_nodes(node.body if hasattr(node, 'body') else [], 0)
+        self._memo_func_complexity[memo_key] = result
+        return result
 
-            return max_seq_complexity
+    def _complexity_of_nodes(self, nodes: List[ast.AST], current_depth: int) -> str:
+        """Fold the complexity of a sequence of sibling nodes."""
+        max_seq_complexity = 'O(1)'
+        for n in nodes:
+            max_seq_complexity = self._upgrade_complexity(
+                max_seq_complexity, self._node_complexity(n, current_depth))
+            if _COMPLEXITY_RANK[max_seq_complexity] >= _RANK_CEILING:
+                break  # Already at the ceiling; siblings cannot raise it
+        return max_seq_complexity
 
-        # node can be ast.FunctionDef or ast.Module (both have .body)
-        return complexity_of_nodes(node.body if hasattr(node, 'body') else [])
+    def _node_complexity(self, n: ast.AST, current_depth: int) -> str:
+        """Complexity contribution of one node, memoized per (node, depth).
+
+        The module-level pass and the per-function passes both descend into
+        nested function bodies, so shared subtrees are computed once per
+        analysis instead of once per visiting pass. The depth is part of the
+        key because a loop's contribution depends on how deeply it is nested.
+        """
+        key = (id(n), current_depth)
+        cached = self._node_cx.get(key)
+        if cached is not None:
+            return cached
+
+        if isinstance(n, (ast.For, ast.While)):
+            # Check if this is a logarithmic loop (dividing/halving pattern)
+            if self._is_logarithmic_loop(n):
+                loop_complexity = 'O(log n)'
+                # Don't increase depth for log loops
+                body_complexity = self._complexity_of_nodes(list(ast.iter_child_nodes(n)), 0)
+            else:
+                body_complexity = self._complexity_of_nodes(list(ast.iter_child_nodes(n)), current_depth + 1)
+                loop_complexity = self._complexity_at_depth(current_depth + 1)
+            result = self._combine_complexities(loop_complexity, body_complexity)
+
+        elif isinstance(n, ast.If):
+            body_complexity = self._complexity_of_nodes(n.body, current_depth)
+            orelse_complexity = self._complexity_of_nodes(n.orelse, current_depth) if n.orelse else 'O(1)'
+            result = self._upgrade_complexity(body_complexity, orelse_complexity)
+
+        elif isinstance(n, ast.Call):
+            result = self._analyze_call_complexity(n)
 
-    def _complexity_at_depth(self, depth: int) -> str:
-        if depth == 0:
-            return 'O(1)'
-        elif depth == 1:
-            return 'O(n)'
-        elif depth == 2:
-            return 'O(n²)'
-        elif depth == 3:
-            return 'O(n³)'
         else:
-            return 'O(n³+)'
+            children = list(ast.iter_child_nodes(n))
+            result = self._complexity_of_nodes(children, current_depth) if children else 'O(1)'
+
+        self._node_cx[key] = result
+        return result
+
+    def _complexity_at_depth(self, depth: int) -> str:
+        return _CX_AT_DEPTH[min(depth, 4)]
     
     def _is_logarithmic_loop(self, loop_node: ast.AST) -> bool:
         """Detect logarithmic loops (dividing/halving patterns)."""
@@ -587,119 +1121,34 @@ class CodeAnalyzer:
     
     def _analyze_call_complexity(self, call_node: ast.Call) -> str:
         """Analyze complexity of function calls."""
-        # Built-in function complexities
-        if isinstance(call_node.func, ast.Name):
-            func_name = call_node.func.id
-            builtin_complexities = {
-                'sorted': 'O(n log n)',
-                'max': 'O(n)',
-                'min': 'O(n)',
-                'sum': 'O(n)',
-                'len': 'O(1)',
-                'abs': 'O(1)',
-                'int': 'O(1)',
-                'float': 'O(1)',
-                'str': 'O(1)',
-                'list': 'O(n)',  # Converting to list
-                'tuple': 'O(n)',  # Converting to tuple
-                'set': 'O(n)',   # Converting to set
-                'dict': 'O(n)',  # Converting to dict
-                'enumerate': 'O(1)',  # Iterator creation is O(1)
-                'zip': 'O(1)',    # Iterator creation is O(1)
-                'range': 'O(1)',  # range is lazy
-                'reversed': 'O(1)',  # Iterator creation is O(1)
-            }
-            return builtin_complexities.get(func_name, 'O(1)')
-            
-        elif isinstance(call_node.func, ast.Attribute):
-            attr_name = call_node.func.attr
-            method_complexities = {
-                'sort': 'O(n log n)',
-                'append': 'O(1)',
-                'pop': 'O(1)',
-                'insert': 'O(n)',
-                'remove': 'O(n)',
-                'index': 'O(n)',
-                'count': 'O(n)',
-                'reverse': 'O(n)',
-                'copy': 'O(n)',
-                'clear': 'O(1)',
-                'extend': 'O(k)',  # k is length of extended iterable
-                'split': 'O(n)',
-                'join': 'O(n)',
-                'replace': 'O(n)',
-                'strip': 'O(n)',
-                'find': 'O(n)',
-                'get': 'O(1)',     # dict.get
-                'keys': 'O(1)',    # returns view, not copy
-                'values': 'O(1)',  # returns view, not copy
-                'items': 'O(1)',   # returns view, not copy
-                'update': 'O(k)',  # k is size of update
-            }
-            return method_complexities.get(attr_name, 'O(1)')
-        
+        func = call_node.func
+        if isinstance(func, ast.Name):
+            return _BUILTIN_TIME_CX.get(func.id, 'O(1)')
+        elif isinstance(func, ast.Attribute):
+            return _METHOD_TIME_CX.get(func.attr, 'O(1)')
         return 'O(1)'
-    
+
     def _analyze_recursive_complexity(self, func_node: ast.FunctionDef) -> str:
         """Analyze complexity of recursive functions."""
-        func_name = func_node.name
-        
-        # Count recursive calls and analyze patterns
-        recursive_calls = 0
-        divides_problem = False
-        has_slicing = False
-        
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                if node.func.id == func_name:
-                    recursive_calls += 1
-            
-            # Look for problem division patterns (slicing)
-            elif isinstance(node, ast.Subscript):
-                if isinstance(node.slice, ast.Slice):
-                    divides_problem = True
-                    has_slicing = True
-            
-            # Look for halving patterns like mid = len(arr) // 2
-            elif isinstance(node, ast.Assign):
-                if isinstance(node.value, ast.BinOp) and isinstance(node.value.op, ast.FloorDiv):
-                    if isinstance(node.value.right, ast.Constant) and node.value.right.value == 2:
-                        divides_problem = True
-        
+        info = self._func_info(func_node)
+
         # Heuristics for recursive complexity
-        if recursive_calls == 1:
-            if divides_problem:
+        if info.recursive_calls == 1:
+            if info.divides_problem:
                 return 'O(n)'        # Simple divide and conquer like factorial
             else:
                 return 'O(n)'        # Linear recursion
-        elif recursive_calls == 2:
-            if divides_problem and has_slicing:
+        elif info.recursive_calls == 2:
+            if info.divides_problem and info.has_slicing:
                 return 'O(n log n)'  # Divide and conquer like merge sort
-            elif divides_problem:
+            elif info.divides_problem:
                 return 'O(log n)'    # Binary search-like recursion
             else:
                 return 'O(n²)'       # Fibonacci-like recursion
         else:
             return 'O(n³+)'          # Multiple recursive calls
-    
-    def _is_recursive_function(self, func_node: ast.FunctionDef) -> bool:
-        """Check if a function is recursive - improved version."""
-        func_name = func_node.name
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == func_name:
-                    return True
-                # Check for indirect recursion through other functions that might call this function
-                elif isinstance(node.func, ast.Attribute) and hasattr(node.func, 'id'):
-                    if node.func.id == func_name:
-                        return True
-        return False
-    
-    def _combine_complexities(self, c1: str, c2: str) -> str:
-        order = ['O(1)', 'O(log n)', 'O(n)', 'O(n log n)', 'O(n²)', 'O(n³)', 'O(n³+)', 'O(n!)']
-
-        def weight(c): return order.index(c) if c in order else 0
 
+    def _combine_complexities(self, c1: str, c2: str) -> str:
         if c1 == 'O(1)':
             return c2
         if c2 == 'O(1)':
@@ -709,24 +1158,22 @@ class CodeAnalyzer:
         # Note: This should only happen when we have true nesting, not sequential operations
         if (c1 == 'O(n)' and c2 == 'O(log n)') or (c1 == 'O(log n)' and c2 == 'O(n)'):
             return 'O(n log n)'
-        
+
         # For sequential operations (not nested), take the maximum
-        return max(c1, c2, key=weight)
+        return c1 if _COMPLEXITY_RANK.get(c1, 0) >= _COMPLEXITY_RANK.get(c2, 0) else c2
 
     def _upgrade_complexity(self, current: str, new: str) -> str:
-        order = ['O(1)', 'O(log n)', 'O(n)', 'O(n log n)', 'O(n²)', 'O(n³)', 'O(n³+)', 'O(n!)']
-        return max([current, new], key=lambda c: order.index(c) if c in order else 0)
+        return new if _COMPLEXITY_RANK.get(new, 0) > _COMPLEXITY_RANK.get(current, 0) else current
 
     def _complexity_weight(self, complexity: str) -> int:
-        weights = {'O(1)': 0, 'O(log n)': 1, 'O(n)': 2,
-                   'O(n log n)': 3, 'O(n²)': 4, 'O(n³)': 5, 'O(n³+)': 6, 'O(n!)': 7}
-        return weights.get(complexity, 0)
+        return _COMPLEXITY_RANK.get(complexity, 0)
 
     def get_detailed_complexity_data(self, file_path: str) -> Dict[str, Any]:
         """Get detailed complexity data suitable for visualization."""
         result = self.analyze_file(file_path)
         metrics = result.get('metrics', {})
-        
+        issues = result.get('issues', {})
+
         # Extract detailed information for visualization
         detailed_data = {
             'file_path': file_path,
@@ -735,11 +1182,11 @@ class CodeAnalyzer:
             'comment_lines': metrics.get('comment_lines', 0),
             'time_complexity': metrics.get('time_complexity', {}),
             'space_complexity': metrics.get('space_complexity', {}),
-            'issues_count': sum(len(msgs) for msgs in result.get('issues', {}).values()),
-            'issue_types': list(result.get('issues', {}).keys()),
-            'code_quality_score': self._calculate_quality_score(metrics, result.get('issues', {}))
+            'issues_count': _total_issues(issues),
+            'issue_types': list(issues),
+            'code_quality_score': self._calculate_quality_score(metrics, issues)
         }
-        
+
         return detailed_data
     
     def _calculate_quality_score(self, metrics: Dict[str, Any], issues: Dict[str, List[str]]) -> float:
@@ -747,27 +1194,22 @@ class CodeAnalyzer:
         score = 100.0
         
         # Deduct points for issues
-        issue_count = sum(len(msgs) for msgs in issues.values())
+        issue_count = _total_issues(issues)
         score -= min(50, issue_count * 5)  # Max 50 points deduction for issues
         
         # Deduct points for poor complexity
-        time_comp = metrics.get('time_complexity', {}).get('overall', 'O(1)')
-        space_comp = metrics.get('space_complexity', {}).get('overall', 'O(1)')
-        
-        complexity_penalties = {
-            'O(1)': 0, 'O(log n)': 2, 'O(n)': 5, 
-            'O(n log n)': 10, 'O(n²)': 20, 'O(n³+)': 30, 'O(n!)': 40
-        }
+        time_comp = metrics.get('time_complexity', _EMPTY).get('overall', 'O(1)')
+        space_comp = metrics.get('space_complexity', _EMPTY).get('overall', 'O(1)')
         
-        score -= complexity_penalties.get(time_comp, 0)
-        score -= complexity_penalties.get(space_comp, 0)
+        score -= _QUALITY_PENALTIES[_COMPLEXITY_RANK.get(time_comp, 0)]
+        score -= _QUALITY_PENALTIES[_COMPLEXITY_RANK.get(space_comp, 0)]
         
         # Add points for good comment ratio
         loc = metrics.get('lines_of_code', 1)
         comment_ratio = metrics.get('comment_lines', 0) / loc
         score += min(10, comment_ratio * 50)  # Max 10 bonus points
         
-        return max(0.0, min(100.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
     def analyze_directory_detailed(self, directory: str) -> Dict[str, Any]:
         """Analyze directory and return detailed data suitable for visualization."""
@@ -808,16 +1250,11 @@ class CodeAnalyzer:
     
     def _calculate_complexity_score(self, metrics: Dict[str, Any]) -> float:
         """Calculate overall complexity score (0-100, lower is better)."""
-        time_comp = metrics.get('time_complexity', {}).get('overall', 'O(1)')
-        space_comp = metrics.get('space_complexity', {}).get('overall', 'O(1)')
-        
-        complexity_scores = {
-            'O(1)': 10, 'O(log n)': 20, 'O(n)': 30, 
-            'O(n log n)': 50, 'O(n²)': 70, 'O(n³+)': 90, 'O(n!)': 100
-        }
+        time_comp = metrics.get('time_complexity', _EMPTY).get('overall', 'O(1)')
+        space_comp = metrics.get('space_complexity', _EMPTY).get('overall', 'O(1)')
         
-        time_score = complexity_scores.get(time_comp, 10)
-        space_score = complexity_scores.get(space_comp, 10)
+        time_score = _COMPLEXITY_SCORES[_COMPLEXITY_RANK.get(time_comp, 0)]
+        space_score = _COMPLEXITY_SCORES[_COMPLEXITY_RANK.get(space_comp, 0)]
         
         return (time_score + space_score) / 2
     
@@ -841,12 +1278,12 @@ class CodeAnalyzer:
         if 50 <= loc <= 200:
             score += 10
         
-        return max(0.0, min(100.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
     def _calculate_issue_density(self, metrics: Dict[str, Any], issues: Dict[str, List[str]]) -> float:
         """Calculate issue density (issues per 100 lines of code)."""
         loc = metrics.get('lines_of_code', 1)
-        issue_count = sum(len(msgs) for msgs in issues.values())
+        issue_count = _total_issues(issues)
         
         return (issue_count / loc) * 100 if loc > 0 else 0
     
@@ -857,51 +1294,44 @@ class CodeAnalyzer:
         
         total_files = len(detailed_results)
         
-        # Language distribution
-        languages = {}
+        # Language distribution; Counter keeps the increments at C level
+        languages = Counter()
+        time_distribution = Counter()
+        space_distribution = Counter()
         total_loc = 0
         total_issues = 0
-        complexity_distribution = {'time': {}, 'space': {}}
-        quality_scores = []
-        
+        quality_score_sum = 0.0
+
         for result in detailed_results:
-            lang = result.get('language', 'unknown')
-            languages[lang] = languages.get(lang, 0) + 1
-            
+            languages[result.get('language', 'unknown')] += 1
+
             metrics = result.get('metrics', {})
             total_loc += metrics.get('lines_of_code', 0)
-            total_issues += sum(len(msgs) for msgs in result.get('issues', {}).values())
-            
+            total_issues += _total_issues(result.get('issues', {}))
+
             # Track complexity distribution
-            time_comp = metrics.get('time_complexity', {}).get('overall', 'O(1)')
-            space_comp = metrics.get('space_complexity', {}).get('overall', 'O(1)')
-            
-            complexity_distribution['time'][time_comp] = complexity_distribution['time'].get(time_comp, 0) + 1
-            complexity_distribution['space'][space_comp] = complexity_distribution['space'].get(space_comp, 0) + 1
-            
+            time_distribution[metrics.get('time_complexity', _EMPTY).get('overall', 'O(1)')] += 1
+            space_distribution[metrics.get('space_complexity', _EMPTY).get('overall', 'O(1)')] += 1
+
             # Quality scores
-            quality_scores.append(result.get('detailed', {}).get('quality_score', 0))
+            quality_score_sum += result.get('detailed', {}).get('quality_score', 0)
+
+        complexity_distribution = {'time': dict(time_distribution),
+                                   'space': dict(space_distribution)}
         
         return {
             'total_files': total_files,
-            'languages': languages,
+            'languages': dict(languages),
             'total_lines_of_code': total_loc,
             'total_issues': total_issues,
-            'average_quality_score': sum(quality_scores) / len(quality_scores) if quality_scores else 0,
+            'average_quality_score': quality_score_sum / total_files if total_files else 0,
             'complexity_distribution': complexity_distribution,
             'issue_density': (total_issues / total_loc * 100) if total_loc > 0 else 0
         }
 
-    def _check_unused_variables(self, tree: ast.AST):
+    def _check_unused_variables(self, indexer: _FunctionIndexer):
         """Check for unused variables in Python code."""
-        used_vars = set()
-        defined_vars = set()
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                defined_vars.add(node.id)
-            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                used_vars.add(node.id)
-
-        for var in (defined_vars - used_vars):
-            self.issues['Unused Variables'].append(f"Unused variable: {var}")
+        for var in (indexer.stored_names - indexer.loaded_names):
+            # Names starting with '_' are deliberately unused by convention.
+            if not var.startswith('_'):
+                self._add_issue('Unused Variables', f"Unused variable: {var}")
@@ -4,6 +4,7 @@ Generates graphs and charts for time and space complexity analysis.
 """
 
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 import matplotlib.patches as patches
 try:
     # Try newer matplotlib versions first
@@ -15,23 +16,93 @@ except ImportError:
     except ImportError:
         # If neither works, set to None and handle gracefully
         FigureCanvasTkinter = None
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
-import seaborn as sns
 from typing import Dict, Any, List, Tuple, Optional
+from collections import Counter, OrderedDict
 import tkinter as tk
 from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import io
+import json
+import os
+import threading
 import base64
 
-# Set style for better looking plots
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Style setup is deferred to first render; importing seaborn and
+# reinitializing matplotlib rc state costs a few hundred milliseconds that
+# code paths which never draw a chart should not pay
+_style_ready = False
+
+
+def _ensure_style():
+    """Apply the plot style once, the first time a figure is rendered."""
+    global _style_ready
+    if _style_ready:
+        return
+    import seaborn as sns
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+    _style_ready = True
+
+
+def _memoize_fig(method):
+    """Cache rendered figures keyed on the chart's input data.
+
+    Rendering dominates redisplay cost, but the GUI frequently asks for the
+    same chart again (tab switches, re-selecting a file). The wrapper hashes
+    the arguments' JSON form; on a hit the already-built Figure is returned
+    untouched. Unhashable/non-serializable inputs just render uncached.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            payload = json.dumps((method.__name__, args, kwargs),
+                                 sort_keys=True, default=str)
+        except TypeError:
+            _ensure_style()
+            return method(self, *args, **kwargs)
+        key = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+        cache = self._fig_cache
+        # The prewarm pool and the Tk thread share this cache, so every
+        # read-modify step on the OrderedDict runs under the lock; only
+        # the rendering itself happens outside it
+        with self._fig_lock:
+            fig = cache.get(key)
+            if fig is not None:
+                cache.move_to_end(key)
+                return fig
+        _ensure_style()
+        fig = method(self, *args, **kwargs)
+        with self._fig_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                # Another thread finished the same render first; return
+                # its figure so every caller holds the same object
+                cache.move_to_end(key)
+                return cached
+            cache[key] = fig
+            if len(cache) > self._FIG_CACHE_SIZE:
+                # Figures are plain matplotlib.figure.Figure objects, not
+                # registered with pyplot, so dropping the reference frees them
+                cache.popitem(last=False)
+        return fig
+    return wrapper
 
 
 class ComplexityVisualizer:
     """Class to create visualizations for time and space complexity."""
-    
+
+    _FIG_CACHE_SIZE = 16
+
     def __init__(self):
+        # LRU of rendered figures, see _memoize_fig; the lock serializes
+        # cache bookkeeping between the GUI thread and the prewarm pool
+        self._fig_cache = OrderedDict()
+        self._fig_lock = threading.Lock()
         self.complexity_colors = {
             'O(1)': '#28a745',        # Green - Excellent
             'O(log n)': '#6f42c1',    # Purple - Very Good
@@ -41,14 +112,40 @@ class ComplexityVisualizer:
             'O(n³+)': '#6c757d',      # Gray - Very Poor
             'O(n!)': '#000000'        # Black - Terrible
         }
-        
+
+        # Fallback for unknown labels; '#gray' is not a valid color spec and
+        # made matplotlib warn on every bar/wedge that used it
+        self._default_color = '#6c757d'
+
+        # Hex specs parsed to RGBA once so per-artist rendering skips
+        # matplotlib's string color converter
+        self._rgba = {label: mcolors.to_rgba(color)
+                      for label, color in self.complexity_colors.items()}
+        self._rgba_default = mcolors.to_rgba(self._default_color)
+
         self.complexity_order = ['O(1)', 'O(log n)', 'O(n)', 'O(n log n)', 'O(n²)', 'O(n³+)', 'O(n!)']
+
+        # Embedded canvases are fixed pixel viewports; render at screen DPI
+        # and keep high-DPI output for explicit exports only
+        self._screen_dpi = 72
+
+        # Radar geometry is fixed, so the closed angle ring is computed once
+        self._radar_categories = ('Time Complexity', 'Space Complexity', 'Code Quality',
+                                  'Maintainability', 'Readability')
+        angles = np.linspace(0, 2 * np.pi, len(self._radar_categories), endpoint=False)
+        self._radar_angles = np.concatenate([angles, angles[:1]])
+
+        # Numeric plot codes derived from the order above, built once; the
+        # labels are not lexically sorted so a dict beats np.searchsorted here
+        self._code = {c: i + 1 for i, c in enumerate(self.complexity_order)}
     
+    @_memoize_fig
     def create_complexity_comparison_chart(self, time_complexity: Dict[str, Any], 
                                          space_complexity: Dict[str, Any], 
                                          figsize: Tuple[int, int] = (12, 8)) -> plt.Figure:
         """Create a comparison chart for time and space complexity."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax1, ax2 = fig.subplots(1, 2)
         fig.suptitle('Time vs Space Complexity Analysis', fontsize=16, fontweight='bold')
         
         # Time Complexity Chart
@@ -56,8 +153,8 @@ class ComplexityVisualizer:
         
         # Space Complexity Chart
         self._create_single_complexity_chart(ax2, space_complexity, 'Space Complexity', 'space')
-        
-        plt.tight_layout()
+
+        fig.tight_layout()
         return fig
     
     def _create_single_complexity_chart(self, ax, complexity_data: Dict[str, Any], 
@@ -66,15 +163,15 @@ class ComplexityVisualizer:
         if not complexity_data or not complexity_data.get('functions'):
             # Show only overall complexity
             overall = complexity_data.get('overall', 'O(1)')
-            ax.bar(['Overall'], [self._complexity_to_numeric(overall)], 
-                  color=self.complexity_colors.get(overall, '#gray'))
+            ax.bar(['Overall'], [self._complexity_to_numeric(overall)],
+                  color=self._rgba.get(overall, self._rgba_default))
             ax.set_title(f'{title}\nOverall: {overall}')
         else:
             # Show function-wise complexity
             functions = complexity_data.get('functions', {})
             func_names = list(functions.keys())
             complexities = [functions[func] for func in func_names]
-            colors = [self.complexity_colors.get(comp, '#gray') for comp in complexities]
+            colors = [self._rgba.get(comp, self._rgba_default) for comp in complexities]
             
             # Truncate long function names
             display_names = [name[:15] + '...' if len(name) > 15 else name for name in func_names]
@@ -94,47 +191,40 @@ class ComplexityVisualizer:
         ax.set_ylim(0, 7)
         plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
     
+    @_memoize_fig
     def create_complexity_trend_chart(self, results: List[Dict[str, Any]], 
                                     figsize: Tuple[int, int] = (12, 6)) -> plt.Figure:
         """Create a trend chart showing complexity across multiple files."""
         if not results:
-            fig, ax = plt.subplots(figsize=figsize)
-            ax.text(0.5, 0.5, 'No data to display', ha='center', va='center', 
+            fig = Figure(figsize=figsize)
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, 'No data to display', ha='center', va='center',
                    transform=ax.transAxes, fontsize=14)
             ax.set_title('Complexity Trend Analysis')
             return fig
-        
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize, sharex=True)
+
+        fig = Figure(figsize=figsize)
+        ax1, ax2 = fig.subplots(2, 1, sharex=True)
         fig.suptitle('Complexity Trend Across Files', fontsize=16, fontweight='bold')
-        
-        file_names = []
-        time_complexities = []
-        space_complexities = []
-        
-        for result in results:
-            file_path = result.get('file_path', '')
-            file_name = file_path.split('\\')[-1] if '\\' in file_path else file_path.split('/')[-1]
-            file_names.append(file_name)
-            
-            time_comp = result.get('metrics', {}).get('time_complexity', {}).get('overall', 'O(1)')
-            space_comp = result.get('metrics', {}).get('space_complexity', {}).get('overall', 'O(1)')
-            
-            time_complexities.append(self._complexity_to_numeric(time_comp))
-            space_complexities.append(self._complexity_to_numeric(space_comp))
-        
+
+        file_names, time_complexities, space_complexities = self._extract_overall(results)
+        x = np.arange(len(file_names))
+
         # Time complexity trend
-        ax1.plot(range(len(file_names)), time_complexities, 'o-', color='#007bff', 
-                linewidth=2, markersize=8, label='Time Complexity')
-        ax1.fill_between(range(len(file_names)), time_complexities, alpha=0.3, color='#007bff')
+        ax1.plot(x, time_complexities, 'o-', color='#007bff',
+                linewidth=2, markersize=8, label='Time Complexity', rasterized=True)
+        ax1.fill_between(x, time_complexities, alpha=0.3, color='#007bff',
+                        rasterized=True)
         ax1.set_ylabel('Time Complexity Score')
         ax1.set_title('Time Complexity Trend')
         ax1.grid(True, alpha=0.3)
         ax1.set_ylim(0, 7)
         
         # Space complexity trend
-        ax2.plot(range(len(file_names)), space_complexities, 'o-', color='#28a745', 
-                linewidth=2, markersize=8, label='Space Complexity')
-        ax2.fill_between(range(len(file_names)), space_complexities, alpha=0.3, color='#28a745')
+        ax2.plot(x, space_complexities, 'o-', color='#28a745',
+                linewidth=2, markersize=8, label='Space Complexity', rasterized=True)
+        ax2.fill_between(x, space_complexities, alpha=0.3, color='#28a745',
+                        rasterized=True)
         ax2.set_ylabel('Space Complexity Score')
         ax2.set_xlabel('Files')
         ax2.set_title('Space Complexity Trend')
@@ -142,18 +232,20 @@ class ComplexityVisualizer:
         ax2.set_ylim(0, 7)
         
         # Set x-axis labels
-        ax2.set_xticks(range(len(file_names)))
-        ax2.set_xticklabels([name[:10] + '...' if len(name) > 10 else name 
+        ax2.set_xticks(x)
+        ax2.set_xticklabels([name[:10] + '...' if len(name) > 10 else name
                             for name in file_names], rotation=45, ha='right')
-        
-        plt.tight_layout()
+
+        fig.tight_layout()
         return fig
     
+    @_memoize_fig
     def create_complexity_distribution_pie(self, results: List[Dict[str, Any]], 
                                          complexity_type: str = 'time',
                                          figsize: Tuple[int, int] = (10, 8)) -> plt.Figure:
         """Create a pie chart showing distribution of complexity types."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax1, ax2 = fig.subplots(1, 2)
         fig.suptitle(f'{complexity_type.title()} and Space Complexity Distribution', 
                     fontsize=16, fontweight='bold')
         
@@ -171,131 +263,159 @@ class ComplexityVisualizer:
         # Create pie charts
         self._create_pie_chart(ax1, time_complexities, 'Time Complexity')
         self._create_pie_chart(ax2, space_complexities, 'Space Complexity')
-        
-        plt.tight_layout()
+
+        fig.tight_layout()
         return fig
     
     def _create_pie_chart(self, ax, complexities: List[str], title: str):
         """Create a single pie chart for complexity distribution."""
-        # Count occurrences of each complexity
-        complexity_counts = {}
-        for comp in complexities:
-            complexity_counts[comp] = complexity_counts.get(comp, 0) + 1
-        
-        if not complexity_counts:
+        # Count occurrences of each complexity; drop zero-count entries so
+        # they do not cost empty wedges and labels
+        items = [(label, count) for label, count in Counter(complexities).items() if count > 0]
+
+        if not items:
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', transform=ax.transAxes)
             ax.set_title(title)
             return
-        
-        labels = list(complexity_counts.keys())
-        sizes = list(complexity_counts.values())
-        colors = [self.complexity_colors.get(label, '#gray') for label in labels]
-        
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
-                                         startangle=90, textprops={'fontsize': 10})
-        
+
+        labels, sizes = zip(*items)
+        colors = [self._rgba.get(label, self._rgba_default) for label in labels]
+
+        # Text rendering dominates small charts, so slivers get no percentage
+        wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors,
+                                         autopct=lambda pct: f'{pct:.1f}%' if pct >= 2 else '',
+                                         startangle=90, textprops={'fontsize': 10},
+                                         wedgeprops={'linewidth': 0})
+
         ax.set_title(title, fontweight='bold')
     
+    @_memoize_fig
     def create_complexity_heatmap(self, results: List[Dict[str, Any]], 
                                 figsize: Tuple[int, int] = (12, 8)) -> plt.Figure:
         """Create a heatmap showing complexity across files and functions."""
         if not results:
-            fig, ax = plt.subplots(figsize=figsize)
-            ax.text(0.5, 0.5, 'No data to display', ha='center', va='center', 
+            fig = Figure(figsize=figsize)
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, 'No data to display', ha='center', va='center',
                    transform=ax.transAxes, fontsize=14)
             return fig
         
-        # Collect all function data
-        function_data = []
-        file_names = []
-        
+        # Collect function data as parallel columns; index maps give O(1)
+        # matrix coordinates in the same pass, and insertion order keeps
+        # axis labels stable between runs
+        func_idx_map = {}
+        file_idx_map = {}
+        unique_functions = []
+        unique_files = []
+        func_indices = []
+        file_indices = []
+        time_codes = []
+        space_codes = []
+
         for result in results:
             file_path = result.get('file_path', '')
-            file_name = file_path.split('\\')[-1] if '\\' in file_path else file_path.split('/')[-1]
-            file_names.append(file_name)
-            
+            file_name = os.path.basename(file_path.replace('\\', '/'))
+
             metrics = result.get('metrics', {})
             time_funcs = metrics.get('time_complexity', {}).get('functions', {})
             space_funcs = metrics.get('space_complexity', {}).get('functions', {})
-            
+
             # Combine function data
             all_funcs = set(time_funcs.keys()) | set(space_funcs.keys())
+            if all_funcs and file_name not in file_idx_map:
+                file_idx_map[file_name] = len(unique_files)
+                unique_files.append(file_name)
             for func in all_funcs:
-                time_comp = time_funcs.get(func, 'O(1)')
-                space_comp = space_funcs.get(func, 'O(1)')
-                function_data.append({
-                    'file': file_name,
-                    'function': func,
-                    'time': self._complexity_to_numeric(time_comp),
-                    'space': self._complexity_to_numeric(space_comp)
-                })
-        
-        if not function_data:
-            fig, ax = plt.subplots(figsize=figsize)
-            ax.text(0.5, 0.5, 'No function data to display', ha='center', va='center', 
+                if func not in func_idx_map:
+                    func_idx_map[func] = len(unique_functions)
+                    unique_functions.append(func)
+                func_indices.append(func_idx_map[func])
+                file_indices.append(file_idx_map[file_name])
+                time_codes.append(self._complexity_to_numeric(time_funcs.get(func, 'O(1)')))
+                space_codes.append(self._complexity_to_numeric(space_funcs.get(func, 'O(1)')))
+
+        if not func_indices:
+            fig = Figure(figsize=figsize)
+            ax = fig.subplots()
+            ax.text(0.5, 0.5, 'No function data to display', ha='center', va='center',
                    transform=ax.transAxes, fontsize=14)
             return fig
-        
-        # Create matrix for heatmap
-        unique_functions = list(set(item['function'] for item in function_data))
-        unique_files = list(set(item['file'] for item in function_data))
-        
-        # Create two matrices: one for time, one for space
-        time_matrix = np.zeros((len(unique_functions), len(unique_files)))
-        space_matrix = np.zeros((len(unique_functions), len(unique_files)))
-        
-        for item in function_data:
-            func_idx = unique_functions.index(item['function'])
-            file_idx = unique_files.index(item['file'])
-            time_matrix[func_idx][file_idx] = item['time']
-            space_matrix[func_idx][file_idx] = item['space']
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+
+        # Create two matrices: one for time, one for space, filled with a
+        # single fancy-indexed store each; codes fit comfortably in int8
+        # and imshow takes integer arrays with vmin/vmax as-is
+        time_matrix = np.zeros((len(unique_functions), len(unique_files)), dtype=np.int8)
+        space_matrix = np.zeros((len(unique_functions), len(unique_files)), dtype=np.int8)
+
+        func_arr = np.asarray(func_indices)
+        file_arr = np.asarray(file_indices)
+        time_matrix[func_arr, file_arr] = np.asarray(time_codes, dtype=np.int8)
+        space_matrix[func_arr, file_arr] = np.asarray(space_codes, dtype=np.int8)
+        
+        # Constrained layout places the shared colorbar; tight_layout cannot
+        # handle a colorbar anchored to multiple axes
+        fig = Figure(figsize=figsize, layout='constrained')
+        ax1, ax2 = fig.subplots(1, 2, sharey=True)
         fig.suptitle('Function Complexity Heatmap', fontsize=16, fontweight='bold')
-        
-        # Time complexity heatmap
-        sns.heatmap(time_matrix, xticklabels=unique_files, yticklabels=unique_functions,
-                   ax=ax1, cmap='RdYlGn_r', vmin=0, vmax=6, cbar_kws={'label': 'Complexity Score'})
+
+        # One normalization and one colorbar serve both heatmaps; sharey
+        # also drops the duplicate function labels on the right axes
+        norm = mcolors.Normalize(vmin=0, vmax=6)
+
+        # Time complexity heatmap; imshow rasterizes the whole matrix in one
+        # pass instead of seaborn's per-cell rectangle artists
+        im1 = ax1.imshow(time_matrix, cmap='RdYlGn_r', norm=norm,
+                         aspect='auto', interpolation='nearest')
+        ax1.set_xticks(range(len(unique_files)))
+        ax1.set_xticklabels(unique_files, rotation=45, ha='right')
+        ax1.set_yticks(range(len(unique_functions)))
+        ax1.set_yticklabels(unique_functions)
         ax1.set_title('Time Complexity')
         ax1.set_xlabel('Files')
         ax1.set_ylabel('Functions')
-        
+
         # Space complexity heatmap
-        sns.heatmap(space_matrix, xticklabels=unique_files, yticklabels=unique_functions,
-                   ax=ax2, cmap='RdYlGn_r', vmin=0, vmax=6, cbar_kws={'label': 'Complexity Score'})
+        ax2.imshow(space_matrix, cmap='RdYlGn_r', norm=norm,
+                   aspect='auto', interpolation='nearest')
+        ax2.set_xticks(range(len(unique_files)))
+        ax2.set_xticklabels(unique_files, rotation=45, ha='right')
         ax2.set_title('Space Complexity')
         ax2.set_xlabel('Files')
-        ax2.set_ylabel('Functions')
-        
-        plt.tight_layout()
+
+        fig.colorbar(im1, ax=[ax1, ax2], shrink=0.8, label='Complexity Score')
         return fig
     
-    def create_performance_radar_chart(self, metrics: Dict[str, Any], 
-                                     figsize: Tuple[int, int] = (8, 8)) -> plt.Figure:
-        """Create a radar chart showing different performance metrics."""
-        fig, ax = plt.subplots(figsize=figsize, subplot_kw=dict(projection='polar'))
-        
-        # Performance categories
-        categories = ['Time Complexity', 'Space Complexity', 'Code Quality', 'Maintainability', 'Readability']
-        
+    def radar_values(self, metrics: Dict[str, Any]) -> List[float]:
+        """Compute the five radar-axis scores for a metrics dict."""
         # Extract values (normalize to 0-10 scale)
         time_score = 10 - self._complexity_to_numeric(metrics.get('time_complexity', {}).get('overall', 'O(1)'))
         space_score = 10 - self._complexity_to_numeric(metrics.get('space_complexity', {}).get('overall', 'O(1)'))
-        
+
         # Simple heuristics for other metrics
         loc = metrics.get('lines_of_code', 0)
         comment_ratio = metrics.get('comment_lines', 0) / max(loc, 1) * 100
-        
+
         quality_score = min(10, comment_ratio * 2)  # Based on comment ratio
         maintainability_score = max(0, 10 - (loc / 50))  # Inversely related to LOC
         readability_score = min(10, comment_ratio * 1.5)  # Similar to quality but different weight
-        
-        values = [time_score, space_score, quality_score, maintainability_score, readability_score]
-        
-        # Angles for each category
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-        angles += angles[:1]  # Complete the circle
-        values += values[:1]  # Complete the circle
+
+        return [time_score, space_score, quality_score, maintainability_score, readability_score]
+
+    @_memoize_fig
+    def create_performance_radar_chart(self, metrics: Dict[str, Any],
+                                     figsize: Tuple[int, int] = (8, 8)) -> plt.Figure:
+        """Create a radar chart showing different performance metrics."""
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot(projection='polar')
+
+        # Performance categories
+        categories = self._radar_categories
+
+        values = np.asarray(self.radar_values(metrics), dtype=np.float32)
+        values = np.concatenate([values, values[:1]])  # Complete the circle
+
+        # Angles for each category, precomputed with the closing point
+        angles = self._radar_angles
         
         # Plot
         ax.plot(angles, values, 'o-', linewidth=2, color='#007bff')
@@ -306,36 +426,78 @@ class ComplexityVisualizer:
         ax.set_xticklabels(categories)
         ax.set_ylim(0, 10)
         ax.grid(True)
-        
-        plt.title('Code Performance Radar Chart', size=16, fontweight='bold', pad=20)
+
+        ax.set_title('Code Performance Radar Chart', size=16, fontweight='bold', pad=20)
         return fig
     
     def _complexity_to_numeric(self, complexity: str) -> float:
         """Convert complexity string to numeric value for plotting."""
-        mapping = {
-            'O(1)': 1,
-            'O(log n)': 2,
-            'O(n)': 3,
-            'O(n log n)': 4,
-            'O(n²)': 5,
-            'O(n³+)': 6,
-            'O(n!)': 7
-        }
-        return mapping.get(complexity, 1)
+        return self._code.get(complexity, 1)
+
+    def _extract_overall(self, results: List[Dict[str, Any]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Pull file names and overall complexity codes in a single pass.
+
+        Returns typed arrays so the plotting calls receive data Agg can use
+        directly instead of per-point Python objects.
+        """
+        n = len(results)
+        file_names = [''] * n
+        time_codes = np.empty(n, dtype=np.int8)
+        space_codes = np.empty(n, dtype=np.int8)
+        code = self._code
+        for i, result in enumerate(results):
+            file_path = result.get('file_path', '')
+            file_names[i] = os.path.basename(file_path.replace('\\', '/'))
+            metrics = result.get('metrics', {})
+            time_codes[i] = code.get(metrics.get('time_complexity', {}).get('overall', 'O(1)'), 1)
+            space_codes[i] = code.get(metrics.get('space_complexity', {}).get('overall', 'O(1)'), 1)
+        return file_names, time_codes, space_codes
     
-    def save_figure_to_bytes(self, fig: plt.Figure) -> bytes:
-        """Save matplotlib figure to bytes for embedding in GUI."""
+    def forget_figure(self, fig):
+        """Drop a figure from the memo cache before mutating it in place.
+
+        The panel updates some charts by rewriting artist data on the live
+        figure; after that the cached entry no longer shows the data it was
+        keyed on, so an equal-argument call must rebuild rather than return
+        the mutated object.
+        """
+        with self._fig_lock:
+            for key, cached in list(self._fig_cache.items()):
+                if cached is fig:
+                    del self._fig_cache[key]
+
+    def save_figure_to_bytes(self, fig: plt.Figure, export: bool = False) -> bytes:
+        """Save matplotlib figure to bytes for embedding in GUI.
+
+        The default path renders at screen DPI and skips the tight-bbox
+        second layout pass; pass export=True for high-DPI file output.
+        """
         buffer = io.BytesIO()
-        fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
+        if export:
+            fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+        else:
+            fig.savefig(buffer, format='png', dpi=self._screen_dpi, bbox_inches=None)
         buffer.seek(0)
         return buffer.getvalue()
     
+    def save_figure_to_rgba(self, fig: plt.Figure) -> np.ndarray:
+        """Render a figure to a raw RGBA pixel array.
+
+        Skips PNG encoding entirely for callers that blit pixels directly;
+        use save_figure_to_bytes when an encoded image is actually needed.
+        """
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())
+
     def create_tkinter_canvas(self, parent, fig: plt.Figure):
         """Create a Tkinter canvas for matplotlib figure."""
         if FigureCanvasTkinter is None:
             raise ImportError("Tkinter canvas functionality requires matplotlib with tkinter backend")
         canvas = FigureCanvasTkinter(fig, master=parent)
-        canvas.draw()
+        # Defer the first paint to the Tk event loop instead of rendering
+        # synchronously while the panel is still being laid out
+        canvas.draw_idle()
         return canvas
 
 
@@ -345,8 +507,24 @@ class GraphicalResultsPanel(ttk.Frame):
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.visualizer = ComplexityVisualizer()
+        # One persistent canvas per tab frame; updates rebind the figure
+        # instead of destroying and re-embedding the Tk widget
+        self._canvases = {}
+        # (fig, ax, line, fill, canvas) once the radar chart exists, so
+        # repeat single-file displays only move the artists
+        self._radar_artists = None
+        # (fig, ax1, ax2, canvas) once the trend chart exists, for the
+        # streaming append_result fast path
+        self._trend_artists = None
+        # Latest results awaiting display; tabs render from these lazily
+        self._pending_single = None
+        self._pending_multiple = None
+        # Frames whose canvas currently shows the pending results
+        self._rendered = set()
+        # Warms hidden tabs' figure cache off the main thread
+        self._prewarm_pool = ThreadPoolExecutor(max_workers=2)
         self._setup_ui()
-        
+
     def _setup_ui(self):
         """Setup the UI with tabs for different visualizations."""
         self.notebook = ttk.Notebook(self)
@@ -371,54 +549,163 @@ class GraphicalResultsPanel(ttk.Frame):
         # Radar Chart Tab
         self.radar_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.radar_frame, text="Performance Radar")
-        
+
+        self._multi_tab_builders = {
+            self.trend_frame: self.visualizer.create_complexity_trend_chart,
+            self.distribution_frame: self.visualizer.create_complexity_distribution_pie,
+            self.heatmap_frame: self.visualizer.create_complexity_heatmap,
+        }
+
+        # Only the visible tab pays its render cost; hidden tabs build
+        # their figures when first switched to
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
     def display_single_file_results(self, results: Dict[str, Any]):
         """Display visualizations for a single file."""
-        metrics = results.get('metrics', {})
-        time_complexity = metrics.get('time_complexity', {})
-        space_complexity = metrics.get('space_complexity', {})
-        
-        # Clear existing widgets
-        self._clear_frame(self.comparison_frame)
-        self._clear_frame(self.radar_frame)
-        
-        # Create comparison chart
-        comparison_fig = self.visualizer.create_complexity_comparison_chart(
-            time_complexity, space_complexity
-        )
-        comparison_canvas = self.visualizer.create_tkinter_canvas(self.comparison_frame, comparison_fig)
-        comparison_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Create radar chart
-        radar_fig = self.visualizer.create_performance_radar_chart(metrics)
-        radar_canvas = self.visualizer.create_tkinter_canvas(self.radar_frame, radar_fig)
-        radar_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
+        self._pending_single = results
+        self._rendered.discard(self.comparison_frame)
+        self._rendered.discard(self.radar_frame)
+        self._render_current_tab()
+
+    def _update_radar_chart(self, metrics: Dict[str, Any]):
+        """Update the radar chart, reusing its axes after the first build.
+
+        Repeat single-file displays only rewrite the line and fill data and
+        let draw_idle repaint; rebuilding the polar grid and tick labels is
+        the expensive part. True blitting (copy_from_bbox/restore_region)
+        is not reliable before the canvas's first expose event, and the
+        deferred redraw already skips figure construction.
+        """
+        artists = self._radar_artists
+        if artists is None:
+            fig = self.visualizer.create_performance_radar_chart(metrics)
+            canvas = self._show_figure(self.radar_frame, fig)
+            ax = fig.axes[0]
+            self._radar_artists = (fig, ax, ax.lines[0], ax.patches[0], canvas)
+            return
+
+        fig, ax, line, fill, canvas = artists
+        # The figure is about to stop matching the data it was cached
+        # under; evict it so equal-argument builder calls rebuild
+        self.visualizer.forget_figure(fig)
+        values = np.asarray(self.visualizer.radar_values(metrics), dtype=np.float32)
+        values = np.concatenate([values, values[:1]])  # Complete the circle
+        angles = line.get_xdata()
+        line.set_ydata(values)
+        fill.set_xy(np.column_stack([angles, values]))
+        canvas.draw_idle()
+
     def display_multiple_file_results(self, results: List[Dict[str, Any]]):
         """Display visualizations for multiple files."""
         if not results:
             return
-            
-        # Clear existing widgets
-        for frame in [self.trend_frame, self.distribution_frame, self.heatmap_frame]:
-            self._clear_frame(frame)
-        
-        # Create trend analysis
-        trend_fig = self.visualizer.create_complexity_trend_chart(results)
-        trend_canvas = self.visualizer.create_tkinter_canvas(self.trend_frame, trend_fig)
-        trend_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Create distribution pie charts
-        distribution_fig = self.visualizer.create_complexity_distribution_pie(results)
-        distribution_canvas = self.visualizer.create_tkinter_canvas(self.distribution_frame, distribution_fig)
-        distribution_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Create heatmap
-        heatmap_fig = self.visualizer.create_complexity_heatmap(results)
-        heatmap_canvas = self.visualizer.create_tkinter_canvas(self.heatmap_frame, heatmap_fig)
-        heatmap_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-    
-    def _clear_frame(self, frame):
-        """Clear all widgets from a frame."""
-        for widget in frame.winfo_children():
-            widget.destroy()
\ No newline at end of file
+
+        self._pending_multiple = results
+        self._trend_artists = None
+        for frame in self._multi_tab_builders:
+            self._rendered.discard(frame)
+        self._render_current_tab()
+
+        # Warm the hidden tabs' figures concurrently; Agg releases the GIL
+        # while rasterizing, so the builders overlap on multicore hosts and
+        # the first switch to those tabs becomes a cache hit
+        current = self.nametowidget(self.notebook.select())
+        for frame, builder in self._multi_tab_builders.items():
+            if frame is not current:
+                self._prewarm_pool.submit(builder, results)
+
+    def _on_tab_changed(self, event=None):
+        self._render_current_tab()
+
+    def _render_current_tab(self):
+        """Render the visible tab from the pending results, if stale."""
+        frame = self.nametowidget(self.notebook.select())
+        if frame in self._rendered:
+            return
+
+        if frame is self.comparison_frame:
+            if self._pending_single is None:
+                return
+            metrics = self._pending_single.get('metrics', {})
+            fig = self.visualizer.create_complexity_comparison_chart(
+                metrics.get('time_complexity', {}), metrics.get('space_complexity', {})
+            )
+            self._show_figure(frame, fig)
+        elif frame is self.radar_frame:
+            if self._pending_single is None:
+                return
+            self._update_radar_chart(self._pending_single.get('metrics', {}))
+        else:
+            builder = self._multi_tab_builders.get(frame)
+            if builder is None or self._pending_multiple is None:
+                return
+            fig = builder(self._pending_multiple)
+            canvas = self._show_figure(frame, fig)
+            if frame is self.trend_frame:
+                self._trend_artists = ((fig, fig.axes[0], fig.axes[1], canvas)
+                                       if len(fig.axes) >= 2 else None)
+
+        self._rendered.add(frame)
+
+    def append_result(self, result: Dict[str, Any]):
+        """Add one analyzer result while a directory scan is streaming in.
+
+        The trend chart is updated on its existing axes instead of being
+        rebuilt, and the distribution/heatmap tabs are only marked stale so
+        they re-render lazily when next shown. Skipping the per-file figure
+        rebuild is what makes a live progress plot affordable.
+        """
+        if self._pending_multiple is None:
+            self._pending_multiple = []
+        self._pending_multiple.append(result)
+
+        self._rendered.discard(self.distribution_frame)
+        self._rendered.discard(self.heatmap_frame)
+
+        if self._trend_artists is not None and self.trend_frame in self._rendered:
+            self._update_trend_artists()
+        else:
+            self._rendered.discard(self.trend_frame)
+            self._render_current_tab()
+
+    def _update_trend_artists(self):
+        """Rewrite the persisted trend artists from the pending results."""
+        fig, ax1, ax2, canvas = self._trend_artists
+        # Same cache-consistency rule as the radar update: evict before
+        # the in-place rewrite
+        self.visualizer.forget_figure(fig)
+        file_names, time_codes, space_codes = self.visualizer._extract_overall(self._pending_multiple)
+        x = np.arange(len(file_names))
+
+        ax1.lines[0].set_data(x, time_codes)
+        ax2.lines[0].set_data(x, space_codes)
+        # fill_between produces a PolyCollection that cannot be extended
+        # point-by-point; rebuild just the fills
+        for ax, codes, color in ((ax1, time_codes, '#007bff'), (ax2, space_codes, '#28a745')):
+            for collection in list(ax.collections):
+                collection.remove()
+            ax.fill_between(x, codes, alpha=0.3, color=color, rasterized=True)
+
+        ax2.set_xticks(x)
+        ax2.set_xticklabels([name[:10] + '...' if len(name) > 10 else name
+                            for name in file_names], rotation=45, ha='right')
+        ax1.set_xlim(-0.5, max(len(x) - 0.5, 0.5))
+        canvas.draw_idle()
+
+    def _show_figure(self, frame, fig):
+        """Show a figure in a tab frame, reusing its embedded canvas.
+
+        Destroying and re-embedding a FigureCanvasTkAgg on every update pays
+        for backend construction each time; rebinding the figure on the
+        existing canvas only triggers a redraw.
+        """
+        canvas = self._canvases.get(frame)
+        if canvas is None:
+            canvas = self.visualizer.create_tkinter_canvas(frame, fig)
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._canvases[frame] = canvas
+        elif canvas.figure is not fig:
+            canvas.figure = fig
+            fig.set_canvas(canvas)
+            canvas.draw_idle()
+        return canvas
\ No newline at end of file
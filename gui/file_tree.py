@@ -1,15 +1,39 @@
-from typing import Optional, Dict, List, Any 
+from typing import Optional, Dict, List, Any
 import os
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
 
+# Supported code file extensions and their Treeview tags, shared across
+# instances instead of rebuilt per directory level
+_TYPE_MAP = {
+    '.py': 'python',
+    '.java': 'java',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.c++': 'cpp',
+    '.h': 'c_header',
+    '.hpp': 'cpp_header',
+    '.hh': 'cpp_header',
+    '.hxx': 'cpp_header'
+}
+_SUPPORTED_EXTENSIONS = frozenset(_TYPE_MAP)
+_TYPE_GET = _TYPE_MAP.get
+
+
 class FileTree(ttk.Treeview):
+    # Stand-in child under unexpanded directories; replaced by the real
+    # entries the first time the node is opened
+    _PLACEHOLDER = '…'
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.heading("#0", text="Project Files", anchor=tk.W)
         self.base_directory = None
-        
+        self.bind("<<TreeviewOpen>>", self._on_open)
+
         # Configure style
         self.style = ttk.Style()
         self.style.configure("Treeview", font=('Consolas', 10))
@@ -31,40 +55,54 @@ class FileTree(ttk.Treeview):
         self._add_children(root_node, path)
         
     def _add_children(self, parent_node, path: Path):
-        """Recursively add children to the tree."""
+        """Add one directory level to the tree.
+
+        Subdirectories get a placeholder child so they show an expand
+        arrow; their real contents are loaded by _on_open the first time
+        the user expands them, keeping load cost proportional to what is
+        actually viewed rather than the whole project.
+        """
+        insert = self.insert
+        # DirEntry carries type information from the directory read itself,
+        # so is_dir/is_file below cost no extra stat calls
         try:
-            # Supported code file extensions
-            supported_extensions = {'.py', '.java', '.c', '.cpp', '.cc', '.cxx', '.c++', '.h', '.hpp', '.hh', '.hxx'}
-            
-            for item in sorted(path.iterdir()):
-                if item.is_dir() and not item.name.startswith('.'):
-                    node = self.insert(parent_node, "end", text=item.name, 
-                                     values=[str(item)])
-                    self._add_children(node, item)
-                elif item.is_file() and item.suffix.lower() in supported_extensions:
-                    # Add different tags based on file type
-                    file_type = self._get_file_type(item.suffix.lower())
-                    self.insert(parent_node, "end", text=item.name, 
-                              values=[str(item)], tags=(file_type,))
-        except PermissionError:
-            pass
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith('.'):
+                        node = insert(parent_node, "end", text=name,
+                                    values=[entry.path])
+                        insert(node, "end", text=self._PLACEHOLDER)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            dot = name.rfind('.')
+            ext = name[dot:].lower() if dot >= 0 else ''
+            if ext in _SUPPORTED_EXTENSIONS:
+                # Add different tags based on file type
+                insert(parent_node, "end", text=name,
+                      values=[entry.path], tags=(_TYPE_GET(ext, 'file'),))
+
+    def _on_open(self, event):
+        """Materialize a directory's children the first time it expands."""
+        node = self.focus()
+        children = self.get_children(node)
+        if children and self.item(children[0], 'text') == self._PLACEHOLDER:
+            self.delete(children[0])
+            values = self.item(node)['values']
+            if values:
+                self._add_children(node, Path(values[0]))
     
     def _get_file_type(self, extension: str) -> str:
         """Get file type tag based on extension."""
-        type_map = {
-            '.py': 'python',
-            '.java': 'java',
-            '.c': 'c',
-            '.cpp': 'cpp',
-            '.cc': 'cpp',
-            '.cxx': 'cpp',
-            '.c++': 'cpp',
-            '.h': 'c_header',
-            '.hpp': 'cpp_header',
-            '.hh': 'cpp_header',
-            '.hxx': 'cpp_header'
-        }
-        return type_map.get(extension, 'file')
+        return _TYPE_GET(extension, 'file')
             
     def get_selected_file(self) -> Optional[str]:
         """Get the full path of the currently selected file."""
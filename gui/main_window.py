@@ -1,4 +1,5 @@
-from typing import Optional, Dict, List, Any    
+from typing import Optional, Dict, List, Any
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
@@ -12,10 +13,9 @@ class MainWindow(tk.Tk):
         super().__init__()
         self.title("Multi-Language Static Code Analyzer")
         self.geometry("1000x700")
-        self.analyzer = CodeAnalyzer()
-        
+
         # Supported file extensions
-        self.supported_extensions = {'.py', '.java', '.c', '.cpp', '.cc', '.cxx', '.c++', '.h', '.hpp', '.hh', '.hxx'}
+        self.supported_extensions = frozenset({'.py', '.java', '.c', '.cpp', '.cc', '.cxx', '.c++', '.h', '.hpp', '.hh', '.hxx'})
         
         self._setup_ui()
         
@@ -78,14 +78,35 @@ class MainWindow(tk.Tk):
         if directory:
             self.file_tree.load_directory(directory)
             
+    def _run_async(self, work, on_done):
+        """Run work() on a background thread, deliver its result via after().
+
+        Analysis is CPU-bound and used to block the Tk event loop; the
+        worker thread keeps the UI live (the analyzer itself fans large
+        directory scans out to a process pool) and on_done runs back on
+        the main thread, where widget updates are safe. Each job builds
+        its own CodeAnalyzer because analyze_file mutates analyzer state —
+        a shared instance would let overlapping jobs cross-contaminate
+        results. The on-disk result cache is still shared between them.
+        """
+        def runner():
+            try:
+                result = work()
+            except Exception as e:
+                self.after(0, messagebox.showerror, "Analysis Error", str(e))
+                return
+            self.after(0, on_done, result)
+
+        threading.Thread(target=runner, daemon=True).start()
+
     def _analyze_current(self):
         """Analyze the currently selected file."""
         selected_file = self.file_tree.get_selected_file()
         if selected_file:
-            file_ext = Path(selected_file).suffix.lower()
+            file_ext = self._file_extension(selected_file)
             if file_ext in self.supported_extensions:
-                result = self.analyzer.analyze_file(selected_file)
-                self.results_panel.display_results(result)
+                self._run_async(lambda: CodeAnalyzer().analyze_file(selected_file),
+                                self.results_panel.display_results)
             else:
                 messagebox.showwarning("Unsupported File", 
                                      f"Please select a supported file type: {', '.join(sorted(self.supported_extensions))}")
@@ -97,18 +118,30 @@ class MainWindow(tk.Tk):
         """Analyze all supported code files in the current directory."""
         base_dir = self.file_tree.base_directory
         if base_dir:
-            results = self.analyzer.analyze_directory(base_dir)
-            if results:
-                self.results_panel.display_multiple_results(results)
-            else:
-                messagebox.showinfo("No Files", "No supported code files found in the directory.")
+            def show(results):
+                if results:
+                    self.results_panel.display_multiple_results(results)
+                else:
+                    messagebox.showinfo("No Files", "No supported code files found in the directory.")
+
+            self._run_async(lambda: CodeAnalyzer().analyze_directory(base_dir), show)
         else:
             messagebox.showwarning("No Directory", "Please open a directory first.")
             
+    @staticmethod
+    def _file_extension(file_path: str) -> str:
+        """Lowercased extension of a path, without building a Path object.
+
+        Selection events fire on every tree navigation step, so the handler
+        avoids the Path allocation that suffix would cost.
+        """
+        _, dot, tail = file_path.rpartition('.')
+        return '.' + tail.lower() if dot else ''
+
     def _on_file_select(self, event):
         """Handle file selection event."""
         selected_file = self.file_tree.get_selected_file()
         if selected_file:
-            file_ext = Path(selected_file).suffix.lower()
+            file_ext = self._file_extension(selected_file)
             if file_ext in self.supported_extensions:
                 self.results_panel.preview_file(selected_file)
\ No newline at end of file
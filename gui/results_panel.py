@@ -1,23 +1,95 @@
+import io
+import os
+import threading
 import tkinter as tk
+from collections import Counter
+from functools import lru_cache
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 from typing import Optional, Dict, Any, List
 
-try:
-    from analyzer.complexity_visualizer import ComplexityVisualizer, GraphicalResultsPanel
-    GRAPHS_AVAILABLE = True
-except ImportError:
-    # Fallback if visualization dependencies are not available
-    GRAPHS_AVAILABLE = False
-    ComplexityVisualizer = None
-    GraphicalResultsPanel = None
+from importlib.util import find_spec
+
+# Whether the graph tabs exist only needs to know the plotting stack is
+# installed; find_spec checks that without importing it. The import
+# itself — hundreds of milliseconds of matplotlib/numpy/seaborn setup —
+# is deferred until the first time a graph is actually drawn.
+GRAPHS_AVAILABLE = all(find_spec(name) is not None
+                       for name in ('matplotlib', 'numpy', 'seaborn'))
+
+# Previews are capped so a multi-megabyte source file cannot balloon the
+# text widget, and inserted in slices so the event loop stays responsive
+_MAX_PREVIEW = 200_000
+_PREVIEW_CHUNK = 65_536
+
+# Issue rows inserted per event-loop turn when populating the Issues tab
+_ISSUE_BATCH = 500
+
+# Stand-in child under collapsed issue groups; replaced by the real file
+# list the first time the group is opened
+_ISSUE_PLACEHOLDER = '…'
+
+
+def _bulk_text_update(widget, content: str):
+    """Replace a read-only Text widget's contents in one operation.
+
+    One delete and one insert means the widget recomputes line layout
+    once, however many report lines the content holds.
+    """
+    widget.config(state=tk.NORMAL)
+    widget.delete(1.0, tk.END)
+    widget.insert(tk.END, content)
+    widget.config(state=tk.DISABLED)
+
+
+@lru_cache(maxsize=64)
+def _read_preview(path: str, mtime: float) -> str:
+    """Read a file for previewing, cached per (path, mtime).
+
+    Re-selecting a recently viewed file hits memory instead of disk; an
+    edited file changes its mtime, so stale entries miss naturally.
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        content = file.read(_MAX_PREVIEW)
+        if file.read(1):
+            content += '\n\n[... truncated ...]'
+    return content
+
 
 class ResultsPanel(ttk.Notebook):
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
-        self.visualizer = ComplexityVisualizer() if GRAPHS_AVAILABLE else None
+        # Built on first use by _get_visualizer so startup never pays the
+        # plotting-stack import
+        self.visualizer = None
+        # Identifies the current preview so stale chunked inserts from a
+        # superseded selection stop themselves
+        self._preview_token = None
+        # Full issue list and the token guarding its batched insertion
+        self._all_issue_rows = []
+        self._issues_token = None
+        # Per-group file lists and the iid -> group key mapping behind the
+        # collapsed duplicate rows
+        self._issue_files = {}
+        self._issue_keys = {}
+        # One embedded canvas per graph tab, created on first use and then
+        # rebound to new figures instead of rebuilt
+        self._graph_canvases = {}
+        # Latest results awaiting a graph redraw, and whether one is queued
+        self._pending_graph_results = None
+        self._graph_redraw_pending = False
+        # Identifies the current multi-file graph build so a superseded
+        # worker thread's figures are discarded
+        self._multi_graphs_token = None
         self._setup_tabs()
         
+    def _get_visualizer(self):
+        """Import and build the visualizer the first time a graph is drawn."""
+        if self.visualizer is None:
+            from analyzer.complexity_visualizer import ComplexityVisualizer
+            self.visualizer = ComplexityVisualizer()
+        return self.visualizer
+
     def _setup_tabs(self):
         """Initialize the tabs for different result types."""
         # Preview tab
@@ -28,14 +100,17 @@ class ResultsPanel(ttk.Notebook):
         self.preview_text.pack(fill=tk.BOTH, expand=True)
         self.add(self.preview_tab, text="Preview")
         
-        # Issues tab
+        # Issues tab; the narrow tree column carries the expand arrows on
+        # grouped issues, the data lives in the two heading columns
         self.issues_tab = ttk.Frame(self)
         self.issues_tree = ttk.Treeview(
-            self.issues_tab, columns=('type', 'message'), show='headings'
+            self.issues_tab, columns=('type', 'message'), show='tree headings'
         )
         self.issues_tree.heading('type', text='Issue Type')
         self.issues_tree.heading('message', text='Message')
+        self.issues_tree.column('#0', width=24, stretch=False)
         self.issues_tree.column('type', width=150)
+        self.issues_tree.bind("<<TreeviewOpen>>", self._on_issue_open)
         scrollbar = ttk.Scrollbar(
             self.issues_tab, orient="vertical", command=self.issues_tree.yview
         )
@@ -87,203 +162,332 @@ class ResultsPanel(ttk.Notebook):
         self.add(self.radar_tab, text="Performance Radar")
         
     def preview_file(self, file_path: str):
-        """Preview the content of a file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                self.preview_text.config(state=tk.NORMAL)
-                self.preview_text.delete(1.0, tk.END)
-                self.preview_text.insert(tk.END, content)
-                self.preview_text.config(state=tk.DISABLED)
-                self.select(self.preview_tab)
-        except Exception as e:
-            self.preview_text.config(state=tk.NORMAL)
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(tk.END, f"Error loading file: {str(e)}")
-            self.preview_text.config(state=tk.DISABLED)
-            
+        """Preview the content of a file.
+
+        The read happens on a worker thread so a slow disk or network
+        mount never stalls the event loop; the result is marshalled back
+        via after(), and the token lets a newer selection orphan any
+        read still in flight.
+        """
+        self._preview_token = token = object()
+        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.config(state=tk.DISABLED)
+        self.select(self.preview_tab)
+
+        def reader():
+            try:
+                content = _read_preview(file_path, os.path.getmtime(file_path))
+            except Exception as e:
+                self.after(0, self._show_preview_error, str(e), token)
+                return
+            self.after(0, self._insert_preview_chunk, content, 0, token)
+
+        threading.Thread(target=reader, daemon=True).start()
+
+    def _show_preview_error(self, message: str, token):
+        """Report a failed preview read, unless a newer one superseded it."""
+        if token is not self._preview_token:
+            return
+        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(tk.END, f"Error loading file: {message}")
+        self.preview_text.config(state=tk.DISABLED)
+
+    def _insert_preview_chunk(self, content: str, offset: int, token):
+        """Insert one slice of the preview, rescheduling for the rest.
+
+        Large previews are fed to the text widget in pieces between event
+        loop turns; the token check abandons the chain when a newer
+        selection has replaced it.
+        """
+        if token is not self._preview_token:
+            return
+        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.insert(tk.END, content[offset:offset + _PREVIEW_CHUNK])
+        self.preview_text.config(state=tk.DISABLED)
+        next_offset = offset + _PREVIEW_CHUNK
+        if next_offset < len(content):
+            self.after_idle(self._insert_preview_chunk, content, next_offset, token)
+
     def display_results(self, results: Dict[str, Any]):
         """Display analysis results."""
         self._display_issues(results.get('issues', {}))
         self._display_metrics(results.get('metrics', {}), results.get('language', 'unknown'))
         
         # Display graphical results if available
-        if GRAPHS_AVAILABLE and self.visualizer:
+        if GRAPHS_AVAILABLE:
             self._display_graphical_results(results)
             
     def _display_graphical_results(self, results: Dict[str, Any]):
-        """Display graphical visualizations for single file results."""
+        """Schedule the single-file graph redraw, coalescing bursts.
+
+        Rapid successive display_results calls (e.g. re-analysis while
+        results are still streaming in) each overwrite the pending
+        results; only one rebuild runs once the burst settles.
+        """
+        self._pending_graph_results = results
+        if not self._graph_redraw_pending:
+            self._graph_redraw_pending = True
+            self.after(50, self._do_graph_redraw)
+
+    def _do_graph_redraw(self):
+        """Build and show the comparison and radar figures."""
+        self._graph_redraw_pending = False
+        results = self._pending_graph_results
         try:
+            visualizer = self._get_visualizer()
             metrics = results.get('metrics', {})
             time_complexity = metrics.get('time_complexity', {})
             space_complexity = metrics.get('space_complexity', {})
             
-            # Clear existing graphs
-            self._clear_tab(self.comparison_tab)
-            self._clear_tab(self.radar_tab)
-            
             # Create complexity comparison chart
             if time_complexity or space_complexity:
-                comparison_fig = self.visualizer.create_complexity_comparison_chart(
+                comparison_fig = visualizer.create_complexity_comparison_chart(
                     time_complexity, space_complexity
                 )
-                comparison_canvas = self.visualizer.create_tkinter_canvas(
-                    self.comparison_tab, comparison_fig
-                )
-                comparison_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
+                self._show_figure(self.comparison_tab, comparison_fig)
+
             # Create performance radar chart
-            radar_fig = self.visualizer.create_performance_radar_chart(metrics)
-            radar_canvas = self.visualizer.create_tkinter_canvas(
-                self.radar_tab, radar_fig
-            )
-            radar_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
+            radar_fig = visualizer.create_performance_radar_chart(metrics)
+            self._show_figure(self.radar_tab, radar_fig)
+
         except Exception as e:
             # If graph generation fails, show error in comparison tab
-            self._clear_tab(self.comparison_tab)
-            error_label = tk.Label(self.comparison_tab, 
-                                 text=f"Error generating graphs: {str(e)}", 
-                                 wraplength=400)
-            error_label.pack(expand=True)
+            self._show_graph_error(self.comparison_tab,
+                                   f"Error generating graphs: {str(e)}")
         
     def display_multiple_results(self, results: List[Dict[str, Any]]):
         """Display results from multiple files."""
         # Clear previous results
         self.issues_tree.delete(*self.issues_tree.get_children())
-        self.metrics_text.config(state=tk.NORMAL)
-        self.metrics_text.delete(1.0, tk.END)
-        
+
         # Language statistics
         language_stats = {}
-        total_metrics = {}
-        
+        total_metrics = Counter()
+        issue_counts = Counter()
+        issue_files = {}
+
         for result in results:
             file_path = result['file_path']
             language = result.get('language', 'unknown')
-            
-            # Track language statistics
+            issues = result.get('issues', {})
+            metrics = result.get('metrics', {})
+
+            # Track language statistics; map(len, ...) keeps the count
+            # entirely in C, where the generator form pays a frame per item
             if language not in language_stats:
                 language_stats[language] = {'files': 0, 'lines': 0, 'issues': 0}
             language_stats[language]['files'] += 1
-            language_stats[language]['lines'] += result.get('metrics', {}).get('lines_of_code', 0)
-            language_stats[language]['issues'] += sum(len(msgs) for msgs in result.get('issues', {}).values())
-            
-            # Add issues with file context
-            for issue_type, messages in result.get('issues', {}).items():
+            language_stats[language]['lines'] += metrics.get('lines_of_code', 0)
+            language_stats[language]['issues'] += sum(map(len, issues.values()))
+
+            # Group identical issue messages; large projects repeat the
+            # same warning across many files, and one row per occurrence
+            # buries everything else
+            for issue_type, messages in issues.items():
                 for msg in messages:
-                    self.issues_tree.insert(
-                        '', 'end', 
-                        values=(issue_type, f"{file_path}: {msg}")
-                    )
-            
-            # Sum metrics (excluding non-numeric ones)
-            for metric, value in result.get('metrics', {}).items():
-                if isinstance(value, (int, float)):
-                    total_metrics[metric] = total_metrics.get(metric, 0) + value
-        
-        # Display statistics
-        self.metrics_text.insert(tk.END, "Project Analysis Summary:\n\n")
+                    key = (issue_type, msg)
+                    issue_counts[key] += 1
+                    issue_files.setdefault(key, []).append(file_path)
+
+            # Sum metrics (excluding non-numeric ones); Counter.update does
+            # the accumulation in C instead of a get-add-store per key
+            total_metrics.update({metric: value
+                                  for metric, value in metrics.items()
+                                  if type(value) in (int, float)})
         
-        self.metrics_text.insert(tk.END, "Languages Analyzed:\n")
+        # Populate the issues tree in batches between event-loop turns so
+        # the window stays interactive while thousands of rows stream in
+        self._all_issue_rows = [(issue_type, msg, count)
+                                for (issue_type, msg), count in issue_counts.items()]
+        self._issue_files = issue_files
+        self._issue_keys = {}
+        self._issues_token = token = object()
+        self._insert_issue_rows(0, token)
+
+        # Display statistics; build the text in Python and hand Tk a single
+        # insert instead of one Tcl round-trip per line
+        buf = io.StringIO()
+        w = buf.write
+        w("Project Analysis Summary:\n\n")
+        w("Languages Analyzed:\n")
         for language, stats in language_stats.items():
-            self.metrics_text.insert(tk.END, f"  {language.upper()}: {stats['files']} files, ")
-            self.metrics_text.insert(tk.END, f"{stats['lines']} lines, {stats['issues']} issues\n")
-        
-        self.metrics_text.insert(tk.END, "\nAggregated Metrics:\n")
+            w(f"  {language.upper()}: {stats['files']} files, ")
+            w(f"{stats['lines']} lines, {stats['issues']} issues\n")
+
+        w("\nAggregated Metrics:\n")
         for metric, value in total_metrics.items():
-            self.metrics_text.insert(tk.END, f"  {metric}: {value}\n")
-        
-        self.metrics_text.config(state=tk.DISABLED)
+            w(f"  {metric}: {value}\n")
+
+        _bulk_text_update(self.metrics_text, buf.getvalue())
         self.select(self.issues_tab)
         
         # Display graphical results for multiple files
-        if GRAPHS_AVAILABLE and self.visualizer and results:
+        if GRAPHS_AVAILABLE and results:
             self._display_multiple_file_graphs(results)
             
     def _display_multiple_file_graphs(self, results: List[Dict[str, Any]]):
-        """Display graphical visualizations for multiple file results."""
-        try:
-            # Clear existing graphs
-            self._clear_tab(self.trend_tab)
-            self._clear_tab(self.distribution_tab)
-            
-            # Create trend analysis
-            trend_fig = self.visualizer.create_complexity_trend_chart(results)
-            trend_canvas = self.visualizer.create_tkinter_canvas(
-                self.trend_tab, trend_fig
-            )
-            trend_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Create distribution charts
-            distribution_fig = self.visualizer.create_complexity_distribution_pie(results)
-            distribution_canvas = self.visualizer.create_tkinter_canvas(
-                self.distribution_tab, distribution_fig
-            )
-            distribution_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-        except Exception as e:
-            # If graph generation fails, show error
-            self._clear_tab(self.trend_tab)
-            error_label = tk.Label(self.trend_tab, 
-                                 text=f"Error generating trend graphs: {str(e)}", 
-                                 wraplength=400)
-            error_label.pack(expand=True)
-            
+        """Display graphical visualizations for multiple file results.
+
+        The figure builds — the expensive part for big result sets — run
+        on a worker thread; the builders construct Figure objects directly
+        and never touch Tk, so only the embed comes back to the main
+        thread via after(). The token orphans a build still in flight when
+        newer results arrive.
+        """
+        self._multi_graphs_token = token = object()
+
+        def build():
+            try:
+                # First use also pays the plotting-stack import here, off
+                # the main thread
+                visualizer = self._get_visualizer()
+                trend_fig = visualizer.create_complexity_trend_chart(results)
+                distribution_fig = visualizer.create_complexity_distribution_pie(results)
+            except Exception as e:
+                self.after(0, self._apply_multi_graph_error, str(e), token)
+                return
+            self.after(0, self._apply_multi_graphs, trend_fig, distribution_fig, token)
+
+        threading.Thread(target=build, daemon=True).start()
+
+    def _apply_multi_graphs(self, trend_fig, distribution_fig, token):
+        """Embed worker-built figures, unless a newer build superseded them."""
+        if token is not self._multi_graphs_token:
+            return
+        self._show_figure(self.trend_tab, trend_fig)
+        self._show_figure(self.distribution_tab, distribution_fig)
+
+    def _apply_multi_graph_error(self, message: str, token):
+        """Report a failed multi-file graph build on the main thread."""
+        if token is not self._multi_graphs_token:
+            return
+        self._show_graph_error(self.trend_tab,
+                               f"Error generating trend graphs: {message}")
+
+    def _show_figure(self, tab_frame, fig):
+        """Show a figure in a tab, reusing the tab's embedded canvas.
+
+        Constructing a FigureCanvasTkAgg and its Tk widget is the heaviest
+        part of an embedded redisplay; after the first build the canvas is
+        kept and simply rebound to each new figure. Figures themselves come
+        out of the visualizer's memo cache, so clearing and replotting into
+        a held figure would defeat that cache.
+        """
+        canvas = self._graph_canvases.get(tab_frame)
+        if canvas is None:
+            self._clear_tab(tab_frame)
+            canvas = self._get_visualizer().create_tkinter_canvas(tab_frame, fig)
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._graph_canvases[tab_frame] = canvas
+        elif canvas.figure is not fig:
+            canvas.figure = fig
+            fig.set_canvas(canvas)
+            canvas.draw_idle()
+
+    def _show_graph_error(self, tab_frame, message: str):
+        """Replace a tab's contents with an error label."""
+        self._graph_canvases.pop(tab_frame, None)
+        self._clear_tab(tab_frame)
+        error_label = tk.Label(tab_frame, text=message, wraplength=400)
+        error_label.pack(expand=True)
+
     def _clear_tab(self, tab_frame):
         """Clear all widgets from a tab frame."""
         for widget in tab_frame.winfo_children():
             widget.destroy()
         
+    def _insert_issue_rows(self, offset: int, token):
+        """Insert one batch of issue rows, rescheduling for the rest.
+
+        The Treeview only renders the rows in view, so the expensive part
+        of huge issue lists is the insert calls themselves; feeding them in
+        batches between event loop turns keeps scrolling and tab switches
+        live while the list fills. The token check abandons the chain when
+        a newer analysis has replaced it.
+        """
+        if token is not self._issues_token:
+            return
+        insert = self.issues_tree.insert
+        for issue_type, msg, count in self._all_issue_rows[offset:offset + _ISSUE_BATCH]:
+            if count > 1:
+                iid = insert('', 'end', values=(issue_type, f"{msg} ×{count}"))
+                self._issue_keys[iid] = (issue_type, msg)
+                insert(iid, 'end', values=('', _ISSUE_PLACEHOLDER))
+            else:
+                # Unique messages keep the inline file context
+                file_path = self._issue_files[(issue_type, msg)][0]
+                insert('', 'end', values=(issue_type, f"{file_path}: {msg}"))
+        next_offset = offset + _ISSUE_BATCH
+        if next_offset < len(self._all_issue_rows):
+            self.after_idle(self._insert_issue_rows, next_offset, token)
+
+    def _on_issue_open(self, event):
+        """Materialize a group's file list the first time it expands."""
+        tree = self.issues_tree
+        node = tree.focus()
+        children = tree.get_children(node)
+        if not (children and tree.item(children[0])['values'][1:] == [_ISSUE_PLACEHOLDER]):
+            return
+        tree.delete(children[0])
+        insert = tree.insert
+        for file_path in self._issue_files.get(self._issue_keys.get(node), ()):
+            insert(node, 'end', values=('', file_path))
+
     def _display_issues(self, issues: Dict[str, List[str]]):
         """Display issues in the issues tree."""
+        self._issues_token = None
         self.issues_tree.delete(*self.issues_tree.get_children())
-        
+
         for issue_type, messages in issues.items():
             for msg in messages:
                 self.issues_tree.insert('', 'end', values=(issue_type, msg))
-        self.select(self.issues_tab) 
+        self.select(self.issues_tab)
         
    # Modify _display_metrics method
     def _display_metrics(self, metrics: Dict[str, Any], language: str = 'unknown'):
-        self.metrics_text.config(state=tk.NORMAL)
-        self.metrics_text.delete(1.0, tk.END)
-    
+        # Build the whole report in a StringIO buffer (C-level growing
+        # string) and hand Tk a single insert; each widget insert is a Tcl
+        # round-trip, which adds up for files with many functions
+        buf = io.StringIO()
+        w = buf.write
+
         # Show language and basic metrics
-        self.metrics_text.insert(tk.END, f"Language: {language.upper()}\n\n")
-        self.metrics_text.insert(tk.END, "Code Metrics:\n")
-        self.metrics_text.insert(tk.END, f"  Lines of code: {metrics.get('lines_of_code', 0)}\n")
-        self.metrics_text.insert(tk.END, f"  Comment lines: {metrics.get('comment_lines', 0)}\n")
-        
+        w(f"Language: {language.upper()}\n\n")
+        w("Code Metrics:\n")
+        w(f"  Lines of code: {metrics.get('lines_of_code', 0)}\n")
+        w(f"  Comment lines: {metrics.get('comment_lines', 0)}\n")
+
         if 'blank_lines' in metrics:
-            self.metrics_text.insert(tk.END, f"  Blank lines: {metrics.get('blank_lines', 0)}\n")
-    
+            w(f"  Blank lines: {metrics.get('blank_lines', 0)}\n")
+
         # Time complexity display
         complexity = metrics.get('time_complexity', {})
-        self.metrics_text.insert(tk.END, "\nTime Complexity:\n")
-        self.metrics_text.insert(tk.END, f"  Overall: {complexity.get('overall', 'Not analyzed')}")
-        
+        w("\nTime Complexity:\n")
+        w(f"  Overall: {complexity.get('overall', 'Not analyzed')}")
+
         if complexity.get('estimated'):
-            self.metrics_text.insert(tk.END, " (estimated)")
-        self.metrics_text.insert(tk.END, "\n")
-    
+            w(" (estimated)")
+        w("\n")
+
         if complexity.get('functions'):
-            self.metrics_text.insert(tk.END, "\n  Per Function:\n")
+            w("\n  Per Function:\n")
             for func, comp in complexity['functions'].items():
-                self.metrics_text.insert(tk.END, f"    {func}: {comp}\n")
-        
+                w(f"    {func}: {comp}\n")
+
         # Space complexity display
         space_complexity = metrics.get('space_complexity', {})
-        self.metrics_text.insert(tk.END, "\nSpace Complexity:\n")
-        self.metrics_text.insert(tk.END, f"  Overall: {space_complexity.get('overall', 'Not analyzed')}")
-        
+        w("\nSpace Complexity:\n")
+        w(f"  Overall: {space_complexity.get('overall', 'Not analyzed')}")
+
         if space_complexity.get('estimated'):
-            self.metrics_text.insert(tk.END, " (estimated)")
-        self.metrics_text.insert(tk.END, "\n")
-    
+            w(" (estimated)")
+        w("\n")
+
         if space_complexity.get('functions'):
-            self.metrics_text.insert(tk.END, "\n  Per Function:\n")
+            w("\n  Per Function:\n")
             for func, comp in space_complexity['functions'].items():
-                self.metrics_text.insert(tk.END, f"    {func}: {comp}\n")
-    
-        self.metrics_text.config(state=tk.DISABLED)
\ No newline at end of file
+                w(f"    {func}: {comp}\n")
+
+        _bulk_text_update(self.metrics_text, buf.getvalue())
\ No newline at end of file
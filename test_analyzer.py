@@ -51,7 +51,7 @@ def test_analyzer():
             # Display issues
             issues = result.get('issues', {})
             if issues:
-                print(f"Issues found: {sum(len(msgs) for msgs in issues.values())}")
+                print(f"Issues found: {sum(map(len, issues.values()))}")
                 for issue_type, messages in issues.items():
                     print(f"  {issue_type}: {len(messages)} issue(s)")
             else:
@@ -79,7 +79,7 @@ def test_analyzer():
         language_stats[language]['lines'] += lines
         total_lines += lines
         
-        issues_count = sum(len(msgs) for msgs in result.get('issues', {}).values())
+        issues_count = sum(map(len, result.get('issues', {}).values()))
         language_stats[language]['issues'] += issues_count
         total_issues += issues_count
     